@@ -9,6 +9,7 @@ import struct
 import sys
 import fnmatch
 import subprocess
+from itertools import islice
 from pyrewall.db.app_signatures import get_all_signatures
 from pyrewall.db.paths import FIREWALL_DB as DEFAULT_DB
 
@@ -176,6 +177,19 @@ def is_firewall_ready():
 
 
 
+def get_firewall_status():
+    """Return (running, ready) from a single read of the controller instance."""
+    inst = _firewall_instance
+    try:
+        if not inst:
+            return False, False
+        running = bool(getattr(inst, "is_alive", lambda: False)())
+        return running, bool(getattr(inst, "_ready", False))
+    except Exception:
+        return False, False
+
+
+
 def notify_firewall_reload():
     """Call from UI to request the running firewall thread reload lists immediately."""
     domain_update_event.set()
@@ -273,6 +287,21 @@ def sync_blocked_ips(db_path=None):
     except Exception as e:
         print(f"[Pyrewall] sync_blocked_ips() error: {e}")
 
+def match_blocked_suffix(host, suffixes):
+    """
+    Return the blocked domain in `suffixes` (a set) that `host` equals or is a subdomain of,
+    else None. Walks the host's label suffixes, so cost is O(labels) set lookups no matter
+    how long the blocklist is.
+    """
+    while host:
+        if host in suffixes:
+            return host
+        dot = host.find(".")
+        if dot < 0:
+            return None
+        host = host[dot + 1:]
+    return None
+
 def reload_blocked_domains(db_path=None):
     db_path = db_path or DEFAULT_DB
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
@@ -281,8 +310,9 @@ def reload_blocked_domains(db_path=None):
         conn = sqlite3.connect(db_path)
         cur = conn.cursor()
         cur.execute("CREATE TABLE IF NOT EXISTS blocked_domains(domain TEXT UNIQUE)")
-        cur.execute("SELECT domain FROM blocked_domains")
-        domains = [row[0].lower() for row in cur.fetchall()]
+        # lowercase + dedup + sort in SQLite; legacy rows may differ only in case
+        cur.execute("SELECT DISTINCT lower(domain) FROM blocked_domains ORDER BY 1")
+        domains = [row[0] for row in cur.fetchall()]
         conn.close()
         return domains
     except Exception as e:
@@ -369,6 +399,44 @@ def add_blocked_domain(domain: str, db_path=None):
         print(f"[Pyrewall] add_blocked_domain() error: {e}")
 
 
+def add_blocked_domains_bulk(domains, db_path=None, chunk_size=500):
+    """
+    Add many domains in one transaction (one commit) and sync IPs once.
+    `domains` may be any iterable, e.g. a generator over a csv.reader; it is consumed in
+    executemany batches of chunk_size, so a large import is never held as one list.
+    Returns the number of domains that were newly inserted (0 if all were already
+    blocked), or None if the write failed.
+    """
+    db_path = db_path or DEFAULT_DB
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    rows = ((d.lower(),) for d in domains if d)
+    added = submitted = 0
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS blocked_domains(domain TEXT UNIQUE)")
+                while batch := list(islice(rows, chunk_size)):
+                    added += conn.executemany(
+                        "INSERT OR IGNORE INTO blocked_domains(domain) VALUES (?)", batch
+                    ).rowcount
+                    submitted += len(batch)
+        finally:
+            conn.close()
+        if not added:
+            return 0
+        print(f"[Pyrewall] Added {added} blocked domains ({submitted} submitted)")
+        try:
+            sync_blocked_ips(db_path=db_path)
+            domain_update_event.set()
+        except Exception as e:
+            print(f"[Pyrewall] Warning: sync_blocked_ips() failed after bulk add: {e}")
+        return added
+    except Exception as e:
+        print(f"[Pyrewall] add_blocked_domains_bulk() error: {e}")
+        return None
+
+
 
 def remove_blocked_domain(domain: str, db_path=None):
     db_path = db_path or DEFAULT_DB
@@ -495,6 +563,7 @@ class FirewallThread(threading.Thread):
 
         # Core runtime state
         self.domains = []
+        self._domain_set = frozenset()  # same domains, for match_blocked_suffix
         self.blocked_ips = set()
         # Load user-defined app signatures (dynamic blocking rules)
         self.app_signatures = get_all_signatures()
@@ -562,6 +631,7 @@ class FirewallThread(threading.Thread):
     def _reload_lists(self):
         try:
             self.domains = reload_blocked_domains(self.db_path)
+            self._domain_set = frozenset(self.domains)
             self.blocked_ips = get_blocked_ips(self.db_path)
             print(f"[Pyrewall] Reloaded {len(self.domains)} domains and {len(self.blocked_ips)} IPs.")
         except Exception as e:
@@ -666,6 +736,7 @@ class FirewallThread(threading.Thread):
 
         # initial load
         self.domains = reload_blocked_domains(self.db_path)
+        self._domain_set = frozenset(self.domains)
         self.blocked_ips = get_blocked_ips(self.db_path)
         self._last_reload = time.time()
         print(f"[Pyrewall] 🔁 Loaded {len(self.domains)} domains and {len(self.blocked_ips)} IPs.")
@@ -780,10 +851,7 @@ class FirewallThread(threading.Thread):
 
 
                         if host:
-                            for d in self.domains:
-                                if host == d or host.endswith("." + d):
-                                    domain_hit = d
-                                    break
+                            domain_hit = match_blocked_suffix(host, self._domain_set)
 
                         # 4) fallback payload scan (brute-force substring)
                         if not domain_hit:
@@ -144,7 +144,8 @@ def validate_user(username: str, password: str, db_path: Optional[str] = None) -
     dpath = db_path or DB_PATH
     _ensure_user_table()
 
-    conn = sqlite3.connect(dpath)
+    # login runs while other tabs may be writing; wait out a lock instead of failing
+    conn = sqlite3.connect(dpath, timeout=5)
     cur = conn.cursor()
     cur.execute("SELECT password FROM users WHERE username = ?", (username,))
     row = cur.fetchone()
@@ -161,7 +162,7 @@ def is_admin(username: str, db_path: Optional[str] = None) -> bool:
     dpath = db_path or DB_PATH
     _ensure_user_table()
 
-    conn = sqlite3.connect(dpath)
+    conn = sqlite3.connect(dpath, timeout=5)
     cur = conn.cursor()
     cur.execute("SELECT role FROM users WHERE username = ?", (username,))
     row = cur.fetchone()
@@ -0,0 +1,92 @@
+# pyrewall/db/connection.py
+"""
+Shared SQLite connection for the general_history database.
+
+HistoryTab, AnalyticsTab and log_general_history all go through
+get_history_conn() so the process keeps one open file and one page cache
+instead of one per caller. The connection is in autocommit mode and may be
+used from any thread; writers hold HISTORY_WRITE_LOCK so an explicit
+transaction on one thread never absorbs another thread's statements.
+
+firewall.db is still opened per use; open_firewall_db() gives those
+short-lived connections the same WAL / synchronous=NORMAL setup.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+
+from pyrewall.db.paths import FIREWALL_DB, GENERAL_HISTORY_DB
+
+# applied once when the connection is opened
+_HISTORY_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA foreign_keys=ON",
+)
+
+# per-connection settings for firewall.db (journal_mode=WAL is stored in the file itself,
+# so it is only switched on once per path per process)
+_FIREWALL_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+)
+_wal_paths = set()
+
+HISTORY_WRITE_LOCK = threading.RLock()
+
+_history_conn = None
+_open_lock = threading.Lock()
+
+
+def get_history_conn() -> sqlite3.Connection:
+    """Return the process-wide general_history connection, opening it on first use."""
+    global _history_conn
+    if _history_conn is None:
+        with _open_lock:
+            if _history_conn is None:
+                path = os.path.abspath(GENERAL_HISTORY_DB)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+                for pragma in _HISTORY_PRAGMAS:
+                    conn.execute(pragma)
+                _history_conn = conn
+    return _history_conn
+
+
+def open_firewall_db(path=FIREWALL_DB, timeout=30.0) -> sqlite3.Connection:
+    """Open a short-lived firewall.db connection in WAL mode with synchronous=NORMAL."""
+    path = os.path.abspath(path)
+    conn = sqlite3.connect(path, timeout=timeout)
+    if path not in _wal_paths:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_paths.add(path)
+    for pragma in _FIREWALL_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def close_history_conn():
+    """Refresh planner stats, truncate the WAL and close the shared connection (registered with atexit)."""
+    global _history_conn
+    with _open_lock:
+        conn, _history_conn = _history_conn, None
+    if conn is not None:
+        try:
+            with HISTORY_WRITE_LOCK:
+                conn.execute("PRAGMA optimize")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            print(f"[Pyrewall] history DB optimize/checkpoint skipped: {e}")
+        try:
+            conn.close()
+        except Exception as e:
+            print(f"[Pyrewall] close_history_conn error: {e}")
+
+
+atexit.register(close_history_conn)
@@ -12,6 +12,7 @@ from datetime import datetime
 from typing import Optional
 
 from pyrewall.db.paths import USERS_DB, GENERAL_HISTORY_DB
+from pyrewall.db.connection import HISTORY_WRITE_LOCK, get_history_conn
 
 # Helper to ensure parent directory exists before opening DB
 def _ensure_db_parent(db_path: str):
@@ -148,24 +149,22 @@ def init_history_db():
 def log_general_history(username: str, action: str, description: str):
     """Log any user/system action into the general_history database."""
     try:
-        _ensure_db_parent(GENERAL_HISTORY_DB)
-        conn = sqlite3.connect(os.path.abspath(GENERAL_HISTORY_DB))
-        cur = conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT,
-                action TEXT,
-                description TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        # shared autocommit connection (pyrewall.db.connection); may be called from any thread
+        with HISTORY_WRITE_LOCK:
+            cur = get_history_conn().cursor()
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT,
+                    action TEXT,
+                    description TEXT,
+                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cur.execute(
+                "INSERT INTO history (username, action, description) VALUES (?, ?, ?)",
+                (username, action, description)
             )
-        """)
-        cur.execute(
-            "INSERT INTO history (username, action, description) VALUES (?, ?, ?)",
-            (username, action, description)
-        )
-        conn.commit()
-        conn.close()
         print(f"[LOG] {username} -> {action}: {description}")
     except Exception as e:
         print(f"[LOG ERROR] Failed to write history: {e}")
@@ -1,5 +1,6 @@
 # pyrewall/ui/components/graph_widget.py
 from collections import deque
+import numpy as np
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import QTimer
 # Prefer qtagg backend for modern matplotlib; fall back to qt5agg
@@ -9,6 +10,56 @@ except Exception:
     from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from typing import Optional, Callable, Iterable
+# numexpr is optional; only used to clamp bulk historic series
+try:
+    import numexpr as ne
+except Exception:
+    ne = None
+
+
+def _clamp_float(v, hi, _isf=(int, float)):
+    """Coerce a sample to float clamped to [0, hi]; bad input becomes 0.0."""
+    if v is None:
+        return 0.0
+    if not isinstance(v, _isf):
+        # slow path only for non-native numerics (numpy scalars, numeric strings)
+        try:
+            v = float(v)
+        except Exception:
+            return 0.0
+    return max(0.0, min(float(v), hi))
+
+
+def _lttb(y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsample of a series sampled at x = 0..n-1.
+    Returns (x_indices, y_values) with n_out points, both float32.
+    """
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.float32), y.astype(np.float32, copy=False)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0] = 0
+    idx[-1] = n - 1
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # average of the next bucket (the last point for the final bucket)
+        nlo = hi
+        nhi = edges[i + 2] if i + 2 < edges.size else n
+        avg_x = (nlo + nhi - 1) / 2.0
+        avg_y = y[nlo:nhi].mean()
+        xs = np.arange(lo, hi)
+        area = np.abs((a - avg_x) * (y[lo:hi] - y[a]) - (a - xs) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx.astype(np.float32), y[idx].astype(np.float32, copy=False)
+
+def _y_top(dl, ul, max_mbps):
+    """Y-axis top: combined max of both series (floor 10) with 15% headroom, clamped."""
+    m = max(10.0, max(dl, default=0.0), max(ul, default=0.0))
+    return min(m * 1.15, max_mbps)
 
 class GraphWidget(QWidget):
     """
@@ -31,17 +82,8 @@ class GraphWidget(QWidget):
 
         self.figure = Figure(figsize=(5, 2.2), tight_layout=True)
         self.canvas = FigureCanvas(self.figure)
-        # after creating self.canvas in __init__, force an initial draw
+        # no forced draw here: the Qt backend paints on the first showEvent
         layout.addWidget(self.canvas)
-        # ensure widget paints at least once
-        try:
-            self.canvas.draw()
-        except Exception:
-            # fallback: draw_idle if draw() unsupported
-            try:
-                self.canvas.draw_idle()
-            except Exception:
-                pass
 
         # Axes and lines
         self.ax = self.figure.add_subplot(111)
@@ -68,26 +110,22 @@ class GraphWidget(QWidget):
         self._timer.timeout.connect(self._on_timer_tick)
         self._live_callback: Optional[Callable[[], Optional[Iterable[float]]]] = None
 
-        # initial draw
+        # bumped whenever the buffers change; keys the downsample cache
+        self._seq = 0
+        self._ds_cache = None
+
+        # initial draw (scheduled via draw_idle)
         self._redraw()
 
     # ---------- Data ingestion ----------
     def push_sample(self, download_mbps: float, upload_mbps: float):
         """Append a single (download, upload) sample. Values clamped to [0, max_mbps]."""
-        try:
-            dl = 0.0 if download_mbps is None else float(download_mbps)
-        except Exception:
-            dl = 0.0
-        try:
-            ul = 0.0 if upload_mbps is None else float(upload_mbps)
-        except Exception:
-            ul = 0.0
-
-        dl = max(0.0, min(dl, self.max_mbps))
-        ul = max(0.0, min(ul, self.max_mbps))
+        dl = _clamp_float(download_mbps, self.max_mbps)
+        ul = _clamp_float(upload_mbps, self.max_mbps)
 
         self.download.append(dl)
         self.upload.append(ul)
+        self._seq += 1
         self._redraw()
 
     def update_graph(self, data):
@@ -107,13 +145,21 @@ class GraphWidget(QWidget):
                     return
                 # Otherwise treat as single historic numeric series
                 try:
-                    nums = [float(x) for x in data]
+                    arr = np.asarray(data[-self.max_points:], dtype=np.float32)
                 except Exception:
                     return
+                # clamp to [0, max_mbps] in one vectorized pass
+                if ne is not None:
+                    arr = ne.evaluate("where(arr < 0, 0, where(arr > m, m, arr))",
+                                      local_dict={"arr": arr, "m": np.float32(self.max_mbps)})
+                else:
+                    np.clip(arr, 0.0, self.max_mbps, out=arr)
                 # right-align into download buffer, leave upload as-is
-                pad = max(0, self.max_points - len(nums))
-                fill = [0.0] * pad + nums[-self.max_points:]
-                self.download = deque(fill, maxlen=self.max_points)
+                pad = self.max_points - arr.size
+                fill = np.zeros(self.max_points, dtype=np.float32)
+                fill[pad:] = arr
+                self.download = deque(fill.tolist(), maxlen=self.max_points)
+                self._seq += 1
                 self._redraw()
                 return
             # single numeric
@@ -162,16 +208,33 @@ class GraphWidget(QWidget):
     # ---------- Rendering ----------
     def _redraw(self):
         try:
-            dl = list(self.download)
-            ul = list(self.upload)
-
             # x indices: 0 .. n-1 (right aligned: newest at the end)
-            n = max(1, len(dl))
-            x = list(range(n))
+            n = max(1, len(self.download))
 
-            # update line data
-            self.line_dl.set_data(x, dl)
-            self.line_ul.set_data(x, ul)
+            # update line data; very long buffers are downsampled to ~canvas width
+            target = max(self.canvas.get_width_height()[0], 256)
+            if self.max_points > 2 * target:
+                # target is part of the key: a resize changes the output size without new data.
+                # A hit costs O(target): the buffers are only copied and scanned on a miss.
+                key = (self._seq, n, target)
+                if self._ds_cache is None or self._ds_cache[0] != key:
+                    dl = np.asarray(self.download, dtype=np.float32)
+                    ul = np.asarray(self.upload, dtype=np.float32)
+                    xd, yd = _lttb(dl, target)
+                    xu, yu = _lttb(ul, target)
+                    # y-top from each series' true peak (one C-level max), cached with the key
+                    y_top = _y_top((float(dl.max(initial=0.0)),), (float(ul.max(initial=0.0)),), self.max_mbps)
+                    self._ds_cache = (key, (xd, yd, xu, yu), y_top)
+                _, (xd, yd, xu, yu), y_top = self._ds_cache
+                self.line_dl.set_data(xd, yd)
+                self.line_ul.set_data(xu, yu)
+            else:
+                dl = list(self.download)
+                ul = list(self.upload)
+                x = list(range(n))
+                self.line_dl.set_data(x, dl)
+                self.line_ul.set_data(x, ul)
+                y_top = _y_top(dl, ul, self.max_mbps)
 
             # recompute data limits and autoscale
             try:
@@ -182,8 +245,6 @@ class GraphWidget(QWidget):
                 pass
 
             # autoscale y with some headroom, but clamp at max_mbps
-            current_max = max(max(dl) if dl else 0.0, max(ul) if ul else 0.0, 10.0)
-            y_top = min(max(current_max * 1.15, 10.0), self.max_mbps)
             self.ax.set_ylim(0.0, y_top)
 
             # x limits: show full buffer length (if single point, show small range)
@@ -2,7 +2,7 @@
 from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QMenu, QFileDialog, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal
 import csv
 import io
 import traceback
@@ -24,6 +24,10 @@ class TableWidget(QTableWidget):
 
     row_double_clicked = pyqtSignal(int, list)  # row index, list of values
 
+    # internal: cross-thread marshalling onto the GUI thread (queued)
+    _append_requested = pyqtSignal(list)
+    _load_requested = pyqtSignal(object, object)  # rows, headers
+
     def __init__(self, headers=None, readonly: bool = True, stretch: bool = True):
         headers = headers or []
         super().__init__(0, len(headers))
@@ -44,17 +48,12 @@ class TableWidget(QTableWidget):
         self.verticalHeader().setVisible(False)
         # default to enabled; code will temporarily disable while populating
         self.setSortingEnabled(True)
+        # cached policy so populating never has to probe the view
+        self._sort_enabled = True
+        self._stretch = stretch
 
-        # default resize policy
-        try:
-            if stretch and self.columnCount() > 0:
-                self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-                self.horizontalHeader().setStretchLastSection(True)
-            elif self.columnCount() > 0:
-                self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
-        except Exception:
-            # defensive: print stack for debugging
-            traceback.print_exc()
+        # default resize policy (re-applied whenever the column count changes)
+        self._apply_resize_mode()
 
         # disable editing if requested
         if readonly:
@@ -63,17 +62,24 @@ class TableWidget(QTableWidget):
         # enable context menu
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
 
-    # ---------------------------
-    # Internal helpers
-    # ---------------------------
-    def _call_on_main_thread(self, fn, *args, **kwargs):
-        """If called from a non-main thread, schedule on the Qt main thread."""
-        if threading.current_thread() is threading.main_thread():
-            return fn(*args, **kwargs)
-        else:
-            # schedule on the main thread (single shot)
-            QTimer.singleShot(0, lambda: fn(*args, **kwargs))
-            return None
+        # worker-thread calls are delivered through these queued connections
+        self._append_requested.connect(self.append_row, Qt.ConnectionType.QueuedConnection)
+        self._load_requested.connect(self.load_data, Qt.ConnectionType.QueuedConnection)
+
+    def _apply_resize_mode(self):
+        """Set the header resize policy chosen at construction; a no-op while there are no columns."""
+        try:
+            if self.columnCount() == 0:
+                return
+            header = self.horizontalHeader()
+            if self._stretch:
+                header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+                header.setStretchLastSection(True)
+            else:
+                header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        except Exception:
+            # defensive: print stack for debugging
+            traceback.print_exc()
 
     # ---------------------------
     # Data population API
@@ -86,26 +92,22 @@ class TableWidget(QTableWidget):
         """
         # if not on main thread, schedule it and return
         if threading.current_thread() is not threading.main_thread():
-            return self._call_on_main_thread(self.load_data, rows, headers)
+            self._load_requested.emit(rows, headers)
+            return None
 
-        sorting_was_enabled = False
+        rows = rows or []
+        old_cols = self.columnCount()
+        # only worth suppressing repaint/signals for real batches
+        batch_mode = len(rows) >= 8
         try:
-            rows = rows or []
-
             # temporarily disable sorting to avoid internal reindex issues
-            try:
-                sorting_was_enabled = self.isSortingEnabled()
-                if sorting_was_enabled:
-                    self.setSortingEnabled(False)
-            except Exception:
-                sorting_was_enabled = False
+            if self._sort_enabled:
+                self.setSortingEnabled(False)
 
             # reduce repainting and signals while populating
-            try:
+            if batch_mode:
                 self.setUpdatesEnabled(False)
                 self.blockSignals(True)
-            except Exception:
-                pass
 
             # optional header update
             if headers is not None:
@@ -123,6 +125,9 @@ class TableWidget(QTableWidget):
                     colcount = 1
                 self.setColumnCount(colcount)
 
+            if self.columnCount() != old_cols:
+                self._apply_resize_mode()
+
             # clear existing contents safely
             try:
                 self.clearContents()
@@ -150,23 +155,9 @@ class TableWidget(QTableWidget):
                         item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
                     self.setItem(r, c, item)
 
-            # visual adjustments
+            # visual adjustments (resize mode is only re-set when the column count changes)
             try:
                 self.resizeRowsToContents()
-                # guard header access if no columns
-                if self.columnCount() > 0:
-                    # if using stretch preference, set it
-                    try:
-                        mode = self.horizontalHeader().sectionResizeMode(0)
-                        # if mode isn't ResizeToContents, set to Stretch (keeps readable)
-                        if mode != QHeaderView.ResizeMode.ResizeToContents:
-                            self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-                    except Exception:
-                        # if sectionResizeMode failed, just try a safe Stretch
-                        try:
-                            self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-                        except Exception:
-                            pass
             except Exception:
                 traceback.print_exc()
 
@@ -178,38 +169,26 @@ class TableWidget(QTableWidget):
             traceback.print_exc()
         finally:
             # restore sorting & signals & updates
-            try:
-                if sorting_was_enabled:
-                    self.setSortingEnabled(True)
-            except Exception:
-                pass
-            try:
+            if self._sort_enabled:
+                self.setSortingEnabled(True)
+            if batch_mode:
                 self.blockSignals(False)
                 self.setUpdatesEnabled(True)
-            except Exception:
-                pass
 
     def append_row(self, row):
         """Append a single row (iterable)."""
         # if not on main thread, schedule it and return
         if threading.current_thread() is not threading.main_thread():
-            return self._call_on_main_thread(self.append_row, row)
+            # same shapes the GUI path accepts: sequences as-is, a scalar as a one-cell row
+            if row is None:
+                row = []
+            self._append_requested.emit(list(row) if isinstance(row, (list, tuple)) else [row])
+            return None
 
-        sorting_was_enabled = False
         try:
             # temporarily disable sorting to avoid internal reindex issues
-            try:
-                sorting_was_enabled = self.isSortingEnabled()
-                if sorting_was_enabled:
-                    self.setSortingEnabled(False)
-            except Exception:
-                sorting_was_enabled = False
-
-            try:
-                self.setUpdatesEnabled(False)
-                self.blockSignals(True)
-            except Exception:
-                pass
+            if self._sort_enabled:
+                self.setSortingEnabled(False)
 
             # if no columns defined, try to infer from row
             if self.columnCount() == 0:
@@ -218,6 +197,7 @@ class TableWidget(QTableWidget):
                 except Exception:
                     colcount = 1
                 self.setColumnCount(colcount)
+                self._apply_resize_mode()
 
             r = self.rowCount()
             self.insertRow(r)
@@ -238,35 +218,29 @@ class TableWidget(QTableWidget):
         except Exception:
             traceback.print_exc()
         finally:
-            # restore sorting state, updates and signals
-            try:
-                if sorting_was_enabled:
-                    self.setSortingEnabled(True)
-            except Exception:
-                pass
-            try:
-                self.blockSignals(False)
-                self.setUpdatesEnabled(True)
-            except Exception:
-                pass
+            # restore sorting state
+            if self._sort_enabled:
+                self.setSortingEnabled(True)
 
     # ---------------------------
     # Utilities
     # ---------------------------
+    def _iter_rows(self, include_headers=True):
+        """Yield table contents as tuples (header row first if requested)."""
+        cols = self.columnCount()
+        if include_headers and cols:
+            header_item = self.horizontalHeaderItem
+            yield tuple((h.text() if (h := header_item(c)) else "") for c in range(cols))
+        item = self.item
+        for r in range(self.rowCount()):
+            yield tuple((it.text() if (it := item(r, c)) else "") for c in range(cols))
+
     def to_csv_string(self, include_headers=True):
         """Return CSV content as a string (UTF-8)."""
         try:
             output = io.StringIO()
             writer = csv.writer(output)
-            if include_headers and self.columnCount():
-                headers = [
-                    self.horizontalHeaderItem(c).text() if self.horizontalHeaderItem(c) else ""
-                    for c in range(self.columnCount())
-                ]
-                writer.writerow(headers)
-            for r in range(self.rowCount()):
-                row = [self.item(r, c).text() if self.item(r, c) else "" for c in range(self.columnCount())]
-                writer.writerow(row)
+            writer.writerows(self._iter_rows(include_headers))
             return output.getvalue()
         except Exception:
             traceback.print_exc()
@@ -288,17 +262,9 @@ class TableWidget(QTableWidget):
                         path = files[0]
             if not path:
                 return None
-            with open(path, "w", newline="", encoding="utf-8") as fh:
+            with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
                 writer = csv.writer(fh)
-                if include_headers and self.columnCount():
-                    headers = [
-                        self.horizontalHeaderItem(c).text() if self.horizontalHeaderItem(c) else ""
-                        for c in range(self.columnCount())
-                    ]
-                    writer.writerow(headers)
-                for r in range(self.rowCount()):
-                    row = [self.item(r, c).text() if self.item(r, c) else "" for c in range(self.columnCount())]
-                    writer.writerow(row)
+                writer.writerows(self._iter_rows(include_headers))
             return path
         except Exception:
             traceback.print_exc()
@@ -360,14 +326,13 @@ class TableWidget(QTableWidget):
     def mouseDoubleClickEvent(self, ev):
         """Emit row_double_clicked with row index and row values list on double-click."""
         try:
-            # Qt6: ev.position() returns QPointF; ev.pos() returns QPoint - try both safely
-            try:
-                idx = self.indexAt(ev.position().toPoint())
-            except Exception:
-                idx = self.indexAt(ev.pos())
+            # PyQt6 QMouseEvent always provides position() (QPointF)
+            idx = self.indexAt(ev.position().toPoint())
             if idx.isValid():
                 r = idx.row()
-                values = [self.item(r, c).text() if self.item(r, c) else "" for c in range(self.columnCount())]
+                cols = self.columnCount()
+                item = self.item
+                values = [(it.text() if (it := item(r, c)) else "") for c in range(cols)]
                 try:
                     self.row_double_clicked.emit(r, values)
                 except Exception:
@@ -1,20 +1,20 @@
 # pyrewall/ui/dashboard.py
-import os
+import pathlib
 import time
-import threading
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QTabWidget, QPushButton, QMessageBox, QHBoxLayout
 )
-from PyQt6.QtGui import QFont, QPixmap
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer, Qt
+from PyQt6.QtGui import QFont, QImage, QPixmap
+from PyQt6.QtCore import QMetaObject, QObject, QRunnable, QThreadPool, QTimer, Qt, pyqtSignal, pyqtSlot
 from pyrewall.db.storage import log_general_history
+from pyrewall.utils.helpers import resource_path
 # Import the controller API (preferred) for starting/stopping the firewall thread
 try:
     from pyrewall.core.firewall_thread import (
-        start_firewall, stop_firewall, is_firewall_running, is_firewall_ready
+        start_firewall, stop_firewall, is_firewall_running, is_firewall_ready, get_firewall_status
     )
 except Exception as e:
-    start_firewall = stop_firewall = is_firewall_running = is_firewall_ready = None
+    start_firewall = stop_firewall = is_firewall_running = is_firewall_ready = get_firewall_status = None
     print(f"[Pyrewall] ⚠️ Could not import firewall controller API: {e}")
 
 # new import for centralized button styles (place near other imports)
@@ -26,26 +26,89 @@ from pyrewall.ui.tabs.history_tab import HistoryTab
 from pyrewall.ui.tabs.settings_tab import SettingsTab
 from pyrewall.ui.tabs.overview_tab import OverviewTab
 
-# canonical DB path so UI starts firewall with same DB as rest of the app
+# canonical DB path so UI starts firewall with same DB as rest of the app.
+# Resolved once at import as a plain str; pass this constant around rather
+# than rebuilding the path in handlers.
 try:
     from pyrewall.db.paths import FIREWALL_DB as CANONICAL_DB
 except Exception:
-    CANONICAL_DB = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "db", "firewall.db"))
+    CANONICAL_DB = str(pathlib.Path(__file__).resolve().parent.parent / "db" / "firewall.db")
 
-# a tiny helper object to run callables on the Qt main thread
-class _MainInvoker(QObject):
-    invoke = pyqtSignal(object)
+# LoginPage imports this module, and the admin tab is rarely needed:
+# resolve both on first use and keep the class afterwards
+_LoginPage = None
+_USER_MGMT_CLS = None
 
-_main_invoker = _MainInvoker()
-# ensure calls emitted from worker threads are queued and executed on the Qt main thread
-_main_invoker.invoke.connect(lambda fn: fn(), Qt.ConnectionType.QueuedConnection)
+def _get_login_page():
+    global _LoginPage
+    if _LoginPage is None:
+        from pyrewall.ui.login import LoginPage
+        _LoginPage = LoginPage
+    return _LoginPage
+
+def _user_mgmt_cls():
+    global _USER_MGMT_CLS
+    if _USER_MGMT_CLS is None:
+        from pyrewall.ui.tabs.user_management_tab import UserManagementTab
+        _USER_MGMT_CLS = UserManagementTab
+    return _USER_MGMT_CLS
+
+
+# main tab bar style, shared by every HomePage instance
+_TABS_QSS = """
+    QTabBar::tab {
+        padding: 8px 16px;
+        font-weight: bold;
+        border-radius: 6px;
+        margin: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #0078D7;
+        color: white;
+    }
+    QTabBar::tab:!selected {
+        background-color: #E7E7E7;
+        color: black;
+    }
+"""
+
+# header assets shared by every HomePage; built on first use (needs a QApplication)
+_LOGO_PIXMAP = None
+_TITLE_FONT = None
+_WELCOME_FONT = None
+
+class _LogoSignals(QObject):
+    loaded = pyqtSignal(QImage)
+
+
+class _LogoLoader(QRunnable):
+    """Reads and decodes the header logo off the GUI thread (QImage is thread-safe)."""
+
+    def __init__(self, signals: _LogoSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        img = QImage(resource_path("ui", "FFLogo.png"))
+        try:
+            self.signals.loaded.emit(img)
+        except RuntimeError:
+            # receiver already destroyed
+            pass
+
+# _show_msg level -> static QMessageBox helper ("critical" uses HomePage._err_box)
+_MSG_BOXES = {
+    "information": QMessageBox.information,
+    "warning": QMessageBox.warning,
+}
 
-def call_on_main(fn):
-    """Schedule callable fn to run on the Qt main thread via queued signal."""
-    try:
-        _main_invoker.invoke.emit(fn)
-    except Exception as e:
-        print(f"[Pyrewall] call_on_main failed to emit: {e}")
+def _get_fonts():
+    """(title_font, welcome_font), constructed once per process."""
+    global _TITLE_FONT, _WELCOME_FONT
+    if _TITLE_FONT is None:
+        _TITLE_FONT = QFont("Segoe UI", 14, QFont.Weight.Bold)
+        _WELCOME_FONT = QFont("Helvetica", 18, QFont.Weight.Bold)
+    return _TITLE_FONT, _WELCOME_FONT
 
 
 class HomePage(QWidget):
@@ -55,6 +118,7 @@ class HomePage(QWidget):
         super().__init__()
         self.username = username
         self.role = role
+        self._is_admin = (role or "").lower() == "admin"
 
         # --- Window setup ---
         self.setWindowTitle(f"Pyrewall: Next Generation Firewall - Logged in as {self.username}")
@@ -67,19 +131,26 @@ class HomePage(QWidget):
         header_layout = QHBoxLayout()
 
         logo = QLabel()
-        from pyrewall.utils.helpers import resource_path
-        pixmap = QPixmap(resource_path("ui", "FFLogo.png"))
-
-        if not pixmap.isNull():
-            logo.setPixmap(pixmap.scaled(35, 35, Qt.AspectRatioMode.KeepAspectRatio))
+        self._logo_label = logo
+        if _LOGO_PIXMAP is not None and not _LOGO_PIXMAP.isNull():
+            logo.setPixmap(_LOGO_PIXMAP)
         else:
+            # placeholder until (or unless) the image decodes
             logo.setText("🧱")
+            if _LOGO_PIXMAP is None:
+                self._logo_signals = _LogoSignals(self)
+                self._logo_signals.loaded.connect(self._on_logo_loaded)
+                QThreadPool.globalInstance().start(_LogoLoader(self._logo_signals))
 
+        title_font, welcome_font = _get_fonts()
         title_label = QLabel("Pyrewall NGFW")
-        title_label.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title_label.setFont(title_font)
 
         self.status_label = QLabel("Status: 🔴 Stopped")
         self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        # last applied (text, css) / button state; identical writes are skipped
+        self._last_status = ("Status: 🔴 Stopped", "color: red; font-weight: bold;")
+        self._last_btn_state = None
 
         # Start / Stop / Logout buttons
         self.start_btn = make_button("Start Firewall", variant="success", height=28)
@@ -103,87 +174,79 @@ class HomePage(QWidget):
 
         # Welcome banner
         welcome_label = QLabel(f"Welcome, {self.username} 👋")
-        welcome_label.setFont(QFont("Helvetica", 18, QFont.Weight.Bold))
+        welcome_label.setFont(welcome_font)
         welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_layout.addWidget(welcome_label)
 
         # ========== MAIN TABS ==========
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabBar::tab {
-                padding: 8px 16px;
-                font-weight: bold;
-                border-radius: 6px;
-                margin: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078D7;
-                color: white;
-            }
-            QTabBar::tab:!selected {
-                background-color: #E7E7E7;
-                color: black;
-            }
-        """)
-
-        # --- create Overview first and keep a reference
-        self.overview_tab = OverviewTab(self.username)
-        self.overview_tab.home = self
-        self.tabs.addTab(self.overview_tab, "📊 Overview")
-
-        # create other tabs after overview (so we know their tab indexes)
-        self.network_tab = NetworkControlTab(self.username)
-        self.network_tab.home = self
-        self.tabs.addTab(self.network_tab, "🔧 Network Control")
-        self.tabs.addTab(ThreatsTab(self.username), "🚨 Threats")
-        self.tabs.addTab(RulesTab(self.username), "🛡️ Firewall Rules")
-        self.tabs.addTab(HistoryTab(self.username, self.role), "📜 History")
-        self.tabs.addTab(SettingsTab(self.username), "⚙️ Settings")
-        if role.lower() == "admin":
-            try:
-                from pyrewall.ui.tabs.user_management_tab import UserManagementTab
-                self.user_mgmt_tab = UserManagementTab(self.username)
-                self.tabs.addTab(self.user_mgmt_tab, "👥 User Management")
-            except Exception as e:
-                print(f"[Pyrewall] ⚠️ Could not load User Management tab: {e}")
-
+        self.tabs.setStyleSheet(_TABS_QSS)
+
+        # title -> tab index, valid before lazy tabs are materialized
+        self._tab_titles = {}
+        # index -> (title, factory, attr) for tabs not built yet (kept until a build succeeds)
+        self._tab_factories = {}
+
+        # --- create Overview first and keep a reference (eager: it is the default page)
+        self.overview_tab = self._add_tab(OverviewTab(self.username), "📊 Overview")
+
+        # eager too: it owns the device scanner that keeps live_devices (and the Devices card) current
+        self.network_tab = self._add_tab(NetworkControlTab(self.username), "🔧 Network Control")
+
+        # other tabs get a placeholder and are built on first visit
+        self._add_lazy_tab("🚨 Threats", lambda: ThreatsTab(self.username))
+        self._add_lazy_tab("🛡️ Firewall Rules", lambda: RulesTab(self.username))
+        self._add_lazy_tab("📜 History", lambda: HistoryTab(self.username, self.role))
+        self._add_lazy_tab("⚙️ Settings", lambda: SettingsTab(self.username))
+        if self._is_admin:
+            # the module is imported on first visit, not at login
+            self.user_mgmt_tab = None
+            self._add_lazy_tab("👥 User Management", lambda: _user_mgmt_cls()(self.username),
+                               attr="user_mgmt_tab")
+
+        self.tabs.currentChanged.connect(self._materialize_tab)
+
+        # overview card key -> tab index, resolved once (indexes never shift)
+        titles = self._tab_titles
+        network_idx = titles.get("🔧 Network Control", -1)
+        self._card_to_tab = {
+            "sites": network_idx,  # blocked websites live in NetworkControlTab
+            "rules": titles.get("🛡️ Firewall Rules", -1),
+            "devices": network_idx,
+            "users": titles.get("👥 User Management", -1),
+            "signatures": network_idx,
+            "threats": titles.get("🚨 Threats", -1),
+        }
 
         # connect overview card clicks -> tab switch
         self.overview_tab.card_clicked.connect(self._on_overview_card_clicked)
 
         main_layout.addWidget(self.tabs)
 
-        # set simple back-reference on known tab attributes so tabs can access home (if present)
-        try:
-            if hasattr(self, "network_tab"):
-                self.network_tab.home = self
-            if hasattr(self, "user_mgmt_tab"):
-                self.user_mgmt_tab.home = self
-            # For other tabs that were added inline without named attributes (e.g. RulesTab, ThreatsTab),
-            # iterate through tabs and set `.home` where possible
-            for i in range(self.tabs.count()):
-                w = self.tabs.widget(i)
-                try:
-                    # do not overwrite if already set
-                    if not hasattr(w, "home"):
-                        setattr(w, "home", self)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        # ----------- end notifier & back-references -----------
-
         self.setLayout(main_layout)
 
         # Track runtime state (we no longer create FirewallThread ourselves)
         self._is_running = False
 
+        # start/stop completion is polled by timer ticks on the GUI loop (no worker threads)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(100)
+        self._poll_timer.timeout.connect(self._poll_controller)
+        self._poll_op = None
+        self._poll_deadline = 0.0
+
+        # error dialog built once and reused by _show_msg("critical", ...)
+        self._err_box = QMessageBox(self)
+        self._err_box.setIcon(QMessageBox.Icon.Critical)
+        self._err_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
         # Initialize UI status based on controller (if available)
         self._refresh_status_from_controller()
 
         # Ensure button states reflect initial controller state
         self._apply_button_states()
 
+    @pyqtSlot()
     def notify_overview_update(self):
         """
         Public method child tabs can call to request OverviewTab refresh.
@@ -192,41 +255,95 @@ class HomePage(QWidget):
         """
         try:
             if hasattr(self, "overview_tab") and callable(getattr(self.overview_tab, "refresh_summary", None)):
-                # schedule refresh on Qt main thread via _MainInvoker
+                # schedule refresh on Qt main thread (queued slot invocation)
                 try:
-                    _main_invoker.invoke.emit(self.overview_tab.refresh_summary)
+                    QMetaObject.invokeMethod(self.overview_tab, "refresh_summary", Qt.ConnectionType.QueuedConnection)
                 except Exception as e:
                     # do not call QTimer.singleShot from a worker thread — log and ignore
                     print(f"[Pyrewall] notify_overview_update: failed to invoke on main thread: {e}")
         except Exception as e:
             print(f"[Pyrewall] notify_overview_update error: {e}")
 
-    def _on_overview_card_clicked(self, key):
+    @pyqtSlot(QImage)
+    def _on_logo_loaded(self, img):
+        """Convert the decoded logo on the GUI thread and cache it for later HomePages."""
+        global _LOGO_PIXMAP
+        if img.isNull():
+            # cache the miss too so we don't retry on every login
+            _LOGO_PIXMAP = QPixmap()
+            return
+        _LOGO_PIXMAP = QPixmap.fromImage(img).scaled(35, 35, Qt.AspectRatioMode.KeepAspectRatio)
+        self._logo_label.setPixmap(_LOGO_PIXMAP)
+
+    # ---------------- TABS ---------------- #
+
+    def _add_tab(self, widget, title):
+        """Add a built tab, giving it its `.home` back-reference up front."""
+        widget.home = self
+        self._tab_titles[title] = self.tabs.addTab(widget, title)
+        return widget
+
+    def _add_lazy_tab(self, title, factory, attr=None):
+        """Reserve a tab slot with a placeholder; `factory()` builds the real tab on first visit."""
+        idx = self.tabs.addTab(QWidget(), title)
+        self._tab_factories[idx] = (title, factory, attr)
+        self._tab_titles[title] = idx
+        return idx
+
+    def _build_tab(self, idx):
         """
-        Map overview card keys to tab indexes. Adjust indexes if you change tab order.
+        Swap the placeholder at idx for the real tab without changing the visible tab.
+        Returns the tab widget, or None if the factory failed (it stays queued for a retry).
         """
-        # create a map from keys to tab index (use the exact order you added them)
-        mapping = {
-            "sites": self.tabs.indexOf(self.network_tab),  # blocked websites live in NetworkControlTab
-            "rules": self.tabs.indexOf(self.find_tab("🛡️ Firewall Rules") or self.tabs.widget(0)),
-            "devices": self.tabs.indexOf(self.network_tab),
-            "users": self.tabs.indexOf(getattr(self, "user_mgmt_tab", None)) if hasattr(self, "user_mgmt_tab") else -1,
-            "signatures": self.tabs.indexOf(self.network_tab),
-            "threats": self.tabs.indexOf(self.find_tab("🚨 Threats")),
-        }
+        entry = self._tab_factories.get(idx)
+        if entry is None:
+            return self.tabs.widget(idx)
+        title, factory, attr = entry
+        try:
+            real = factory()
+        except Exception as e:
+            print(f"[Pyrewall] ⚠️ Could not build tab {title}: {e}")
+            return None
+        del self._tab_factories[idx]
+        real.home = self
+        if attr:
+            setattr(self, attr, real)
+        # removeTab/insertTab move the current index; keep currentChanged quiet and put it back
+        current = self.tabs.currentIndex()
+        self.tabs.blockSignals(True)
+        try:
+            placeholder = self.tabs.widget(idx)
+            self.tabs.removeTab(idx)
+            self.tabs.insertTab(idx, real, title)
+            self.tabs.setCurrentIndex(current)
+            if placeholder is not None:
+                placeholder.deleteLater()
+        finally:
+            self.tabs.blockSignals(False)
+        return real
 
-        idx = mapping.get(key, -1)
-        if idx is None or idx < 0:
-            # fallback: open first tab
+    def _materialize_tab(self, idx):
+        """currentChanged handler: build the tab being switched to (first visit) and show it."""
+        if idx not in self._tab_factories:
             return
-        self.tabs.setCurrentIndex(idx)
+        if self._build_tab(idx) is not None:
+            self.tabs.setCurrentIndex(idx)
+
+    @pyqtSlot(str)
+    def _on_overview_card_clicked(self, key):
+        """Switch to the tab mapped to an overview card key (precomputed in __init__)."""
+        idx = self._card_to_tab.get(key, -1)
+        if idx >= 0:
+            self.tabs.setCurrentIndex(idx)
 
     # small helper to find tab by title text (optional convenience)
     def find_tab(self, title_text):
-        for i in range(self.tabs.count()):
-            if self.tabs.tabText(i) == title_text:
-                return self.tabs.widget(i)
-        return None
+        idx = self._tab_titles.get(title_text)
+        if idx is None:
+            return None
+        # build only: looking a tab up must not switch the visible page
+        self._build_tab(idx)
+        return self.tabs.widget(idx)
 
     # ---------------- FIREWALL ---------------- #
 
@@ -235,22 +352,34 @@ class HomePage(QWidget):
         Central helper to set button enabled/disabled and allow temporary text changes.
         start_text/stop_text are optional to show "Starting..." / "Stopping..."
         """
+        # keep default labels if not provided
+        state = (bool(start_enabled), bool(stop_enabled),
+                 "Start Firewall" if start_text is None else start_text,
+                 "Stop Firewall" if stop_text is None else stop_text)
+        if state == self._last_btn_state:
+            return
         try:
-            if start_text is not None:
-                self.start_btn.setText(start_text)
-            else:
-                # keep default label if not provided
-                self.start_btn.setText("Start Firewall")
-            if stop_text is not None:
-                self.stop_btn.setText(stop_text)
-            else:
-                self.stop_btn.setText("Stop Firewall")
-
-            self.start_btn.setEnabled(bool(start_enabled))
-            self.stop_btn.setEnabled(bool(stop_enabled))
+            self.start_btn.setText(state[2])
+            self.stop_btn.setText(state[3])
+            self.start_btn.setEnabled(state[0])
+            self.stop_btn.setEnabled(state[1])
+            self._last_btn_state = state
         except Exception as e:
             print(f"[Pyrewall] ⚠️ _set_buttons_state error: {e}")
 
+    def _set_status(self, text: str, css: str):
+        """Update the status label, skipping no-op writes (avoids a QSS re-parse)."""
+        if (text, css) == self._last_status:
+            return
+        label = self.status_label
+        label.setUpdatesEnabled(False)
+        try:
+            label.setText(text)
+            label.setStyleSheet(css)
+        finally:
+            label.setUpdatesEnabled(True)
+        self._last_status = (text, css)
+
     def _apply_button_states(self):
         """Set button states according to current self._is_running flag."""
         if self._is_running:
@@ -260,166 +389,84 @@ class HomePage(QWidget):
             # stopped -> Start enabled, Stop disabled
             self._set_buttons_state(start_enabled=True, stop_enabled=False)
 
+    @pyqtSlot()
     def _refresh_status_from_controller(self):
         """Query controller for running state and reflect in UI."""
         try:
             running = False
             ready = False
 
-            if callable(is_firewall_running):
+            # one controller round-trip for both flags
+            if callable(get_firewall_status):
                 try:
-                    running = is_firewall_running()
+                    running, ready = get_firewall_status()
                 except Exception as e:
-                    print(f"[Pyrewall] ⚠️ is_firewall_running() call failed: {e}")
+                    print(f"[Pyrewall] ⚠️ get_firewall_status() call failed: {e}")
                     running = getattr(self, "_is_running", False)
 
-            # Prefer explicit readiness if controller provides it
-            if callable(is_firewall_ready):
-                try:
-                    ready = is_firewall_ready()
-                except Exception as e:
-                    print(f"[Pyrewall] ⚠️ is_firewall_ready() call failed: {e}")
-                    ready = False
-
             # Decide UI state:
             # - ready -> Running
             # - running but not ready -> Starting (show disabled Start, disabled Stop until ready)
             # - not running -> Stopped
             if ready:
                 self._is_running = True
-                self.status_label.setText("Status: 🟢 Running")
-                self.status_label.setStyleSheet("color: green; font-weight: bold;")
+                self._set_status("Status: 🟢 Running", "color: green; font-weight: bold;")
             elif running and not ready:
                 # thread alive but not fully ready yet
                 self._is_running = True
-                self.status_label.setText("Status: 🟡 Starting…")
-                self.status_label.setStyleSheet("color: orange; font-weight: bold;")
+                self._set_status("Status: 🟡 Starting…", "color: orange; font-weight: bold;")
             else:
                 self._is_running = False
-                self.status_label.setText("Status: 🔴 Stopped")
-                self.status_label.setStyleSheet("color: red; font-weight: bold;")
+                self._set_status("Status: 🔴 Stopped", "color: red; font-weight: bold;")
         except Exception as e:
             print(f"[Pyrewall] ⚠️ Failed to refresh firewall status: {e}")
         finally:
             # Always ensure buttons reflect the final known state
             self._apply_button_states()
 
+    @pyqtSlot()
     def start_firewall(self):
         """Start the firewall via controller. Uses canonical DB path.
-        Runs controller call in a short worker thread and polls readiness.
+        The controller start is non-blocking; readiness is polled by a GUI-loop timer.
         """
         # Guard against double start attempts
         if self._is_running:
-            QTimer.singleShot(0, lambda: QMessageBox.information(self, "Firewall", "⚙️ Firewall is already running."))
+            self._show_msg("information", "Firewall", "⚙️ Firewall is already running.")
             return
 
         # immediate UI feedback: disable both buttons while starting
         self._set_buttons_state(start_enabled=False, stop_enabled=False, start_text="Starting…",
                                 stop_text="Stop Firewall")
 
-        def _worker():
-            try:
-                if not callable(start_firewall):
-                    # controller missing — show warning on main thread
-                    try:
-                        call_on_main(lambda: QMessageBox.warning(self, "Firewall", "Start not available (controller missing)."))
-                    except Exception as e:
-                        print(f"[Pyrewall] start_firewall: failed to schedule missing-controller warning: {e}")
-
-                    # ensure UI state is refreshed on main thread
-                    try:
-                        call_on_main(self._refresh_status_from_controller)
-                    except Exception as e:
-                        print(f"[Pyrewall] start_firewall: failed to schedule _refresh_status_from_controller: {e}")
-                    return
-
-                # request start (controller launches worker asynchronously)
-                started = start_firewall(db_path=CANONICAL_DB)
-                if not started:
-                    print("[Pyrewall] start_firewall() returned False immediately.")
-
-                    try:
-                        call_on_main(lambda: QMessageBox.critical(self, "Firewall", "❌ Failed to initiate firewall start (see console)."))
-                    except Exception as e:
-                        print(f"[Pyrewall] start_firewall: failed to schedule critical message: {e}")
-
-                    try:
-                        _main_invoker.invoke.emit(self._refresh_status_from_controller)
-                    except Exception:
-                        QTimer.singleShot(0, self._refresh_status_from_controller)
-                    return
-
-                # poll for readiness (prefer is_firewall_ready if available)
-                poll_timeout = 8.0
-                poll_interval = 0.1
-                deadline = time.time() + poll_timeout
-                ready = False
-                while time.time() < deadline:
-                    try:
-                        if callable(is_firewall_ready):
-                            ready = is_firewall_ready()
-                        elif callable(is_firewall_running):
-                            ready = is_firewall_running()
-                        else:
-                            ready = False
-                    except Exception as e:
-                        print(f"[Pyrewall] start worker poll error: {e}")
-                        ready = False
-
-                    if ready:
-                        break
-                    time.sleep(poll_interval)
-
-                if ready:
-                    # update internal flag and post UI updates to main thread
-                    self._is_running = True
-                    print("[Pyrewall] 🔥 Firewall started and ready.")
-
-                    def _on_started():
-                        try:
-                            self.status_label.setText("Status: 🟢 Running")
-                            self.status_label.setStyleSheet("color: green; font-weight: bold;")
-                            log_general_history(self.username, "Firewall", "Started firewall")
-                            QMessageBox.information(self, "Firewall", "✅ Firewall started successfully.")
-                        except Exception:
-                            print("[Pyrewall] Firewall started (could not show QMessageBox on main thread).")
-
-                    try:
-                        call_on_main(_on_started)
-                    except Exception as e:
-                        print(f"[Pyrewall] start_firewall: failed to schedule _on_started: {e}")
-
-                else:
-                    print("[Pyrewall] ❌ Firewall start timed out waiting for readiness.")
-
-                    try:
-                        call_on_main(lambda: QMessageBox.critical(self, "Firewall", "❌ Firewall did not become ready (timed out)."))
-                    except Exception as e:
-                        print(f"[Pyrewall] start_firewall: failed to schedule timeout critical message: {e}")
-
-
-            except Exception as e:
-                print(f"[Pyrewall] ❌ start_firewall worker exception: {e}")
-                try:
-                    call_on_main(lambda: QMessageBox.critical(self, "Firewall Error", f"Failed to start firewall:\n{e}"))
-                except Exception as ex2:
-                    print(f"[Pyrewall] start_firewall: failed to schedule error message: {ex2}")
-
-            finally:
-                # always refresh status & button states on main thread at end
-                try:
-                    call_on_main(self._refresh_status_from_controller)
-                except Exception as e:
-                    print(f"[Pyrewall] start_firewall: failed to schedule final status refresh: {e}")
+        if not callable(start_firewall):
+            self._show_msg("warning", "Firewall", "Start not available (controller missing).")
+            self._refresh_status_from_controller()
+            return
+        try:
+            # request start (controller launches worker asynchronously)
+            started = start_firewall(db_path=CANONICAL_DB)
+        except Exception as e:
+            print(f"[Pyrewall] ❌ start_firewall exception: {e}")
+            self._show_msg("critical", "Firewall Error", f"Failed to start firewall:\n{e}")
+            self._refresh_status_from_controller()
+            return
+        if not started:
+            print("[Pyrewall] start_firewall() returned False immediately.")
+            self._show_msg("critical", "Firewall", "❌ Failed to initiate firewall start (see console).")
+            self._refresh_status_from_controller()
+            return
 
-        threading.Thread(target=_worker, daemon=True).start()
+        self._begin_poll("start")
 
+    @pyqtSlot()
     def stop_firewall(self):
         """Stop the firewall via controller. Ask for confirmation first.
-        Runs controller call in worker thread and polls until thread exits."""
+        The stop request is non-blocking; thread exit is polled by a GUI-loop timer."""
+        # ask the controller once; the answer is reused below
+        running_now = is_firewall_running() if callable(is_firewall_running) else self._is_running
         # if we think it's not running, warn
-        if not self._is_running and callable(is_firewall_running) and not is_firewall_running():
-            QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Firewall", "⚠️ Firewall is not currently running."))
+        if not self._is_running and not running_now:
+            self._show_msg("warning", "Firewall", "⚠️ Firewall is not currently running.")
             return
 
         # Ask user for confirmation on main thread
@@ -431,77 +478,119 @@ class HomePage(QWidget):
         )
         if resp != QMessageBox.StandardButton.Yes:
             # user cancelled — ensure UI returns to correct state
-            try:
-                call_on_main(self._refresh_status_from_controller)
-            except Exception as e:
-                print(f"[Pyrewall] _on_logout_clicked: failed to schedule status refresh: {e}")
+            self._refresh_status_from_controller()
             return
 
         # immediate UI feedback: disable both buttons while stopping
         self._set_buttons_state(start_enabled=False, stop_enabled=False, start_text="Start Firewall",
                                 stop_text="Stopping…")
 
-        def _worker():
-            try:
-                if not callable(stop_firewall):
-                    try:
-                        call_on_main(lambda: QMessageBox.warning(self, "Firewall", "Stop not available (controller missing)."))
-                    except Exception as e:
-                        print(f"[Pyrewall] stop_firewall: failed to schedule missing-controller warning: {e}")
-
-                    try:
-                        call_on_main(self._refresh_status_from_controller)
-                    except Exception as e:
-                        print(f"[Pyrewall] stop_firewall: failed to schedule _refresh_status_from_controller: {e}")
-                    return
-
-                ok = stop_firewall(wait=True, timeout=8.0)
-
-                if ok:
-                    self._is_running = False
-                    print("[Pyrewall] 🛑 Firewall stopped via controller.")
-
-                    def _on_stopped():
-                        try:
-                            self.status_label.setText("Status: 🔴 Stopped")
-                            self.status_label.setStyleSheet("color: red; font-weight: bold;")
-                            log_general_history(self.username, "Firewall", "Stopped firewall")
-                            QMessageBox.information(self, "Firewall", "🛑 Firewall stopped successfully.")
-                        except Exception:
-                            print("[Pyrewall] Firewall stopped (could not show QMessageBox on main thread).")
-
-                    try:
-                        call_on_main(_on_stopped)
-                    except Exception as e:
-                        print(f"[Pyrewall] stop_firewall: failed to schedule _on_stopped: {e}")
+        if not callable(stop_firewall):
+            self._show_msg("warning", "Firewall", "Stop not available (controller missing).")
+            self._refresh_status_from_controller()
+            return
+        try:
+            # signal the worker to stop; don't join on the GUI thread
+            stop_firewall(wait=False)
+        except Exception as e:
+            print(f"[Pyrewall] ❌ stop_firewall exception: {e}")
+            self._show_msg("critical", "Firewall Error", f"Failed to stop firewall:\n{e}")
+            self._refresh_status_from_controller()
+            return
 
-                else:
-                    print("[Pyrewall] ❌ stop_firewall controller reported join timeout / still alive.")
+        if not running_now:
+            # worker was already gone when we asked; nothing to wait for
+            self._on_stopped(True)
+            self._refresh_status_from_controller()
+            return
+        self._begin_poll("stop")
 
-                    try:
-                        call_on_main(lambda: QMessageBox.critical(self, "Firewall", "❌ Failed to stop firewall cleanly (still alive)."))
-                    except Exception as e:
-                        print(f"[Pyrewall] stop_firewall: failed to schedule failed-stop critical message: {e}")
+    def _begin_poll(self, op: str):
+        """Poll the controller every 100 ms until `op` ("start"/"stop") completes or 8 s pass."""
+        self._poll_op = op
+        self._poll_deadline = time.monotonic() + 8.0
+        self._poll_timer.start()
 
+    def _poll_controller(self):
+        try:
+            if callable(get_firewall_status):
+                running, ready = get_firewall_status()
+            else:
+                running = ready = False
+            # start waits for readiness, stop for the worker thread to exit
+            done = ready if self._poll_op == "start" else not running
+        except Exception as e:
+            print(f"[Pyrewall] {self._poll_op} poll error: {e}")
+            done = False
 
-            except Exception as e:
-                print(f"[Pyrewall] ❌ stop_firewall worker exception: {e}")
+        timed_out = time.monotonic() >= self._poll_deadline
+        if not done and not timed_out:
+            return
+        self._poll_timer.stop()
 
-                try:
-                    call_on_main(lambda: QMessageBox.critical(self, "Firewall Error", f"Failed to stop firewall:\n{e}"))
-                except Exception as ex2:
-                    print(f"[Pyrewall] stop_firewall: failed to schedule error message: {ex2}")
+        if self._poll_op == "start":
+            if done:
+                print("[Pyrewall] 🔥 Firewall started and ready.")
+                self._on_started(True)
+            else:
+                print("[Pyrewall] ❌ Firewall start timed out waiting for readiness.")
+                self._show_msg("critical", "Firewall", "❌ Firewall did not become ready (timed out).")
+        else:
+            if done:
+                print("[Pyrewall] 🛑 Firewall stopped via controller.")
+                self._on_stopped(True)
+            else:
+                print("[Pyrewall] ❌ Firewall thread still alive after stop timeout.")
+                self._show_msg("critical", "Firewall", "❌ Failed to stop firewall cleanly (still alive).")
+        # always refresh status & button states at the end
+        self._refresh_status_from_controller()
 
-            finally:
-                try:
-                    call_on_main(self._refresh_status_from_controller)
-                except Exception as e:
-                    print(f"[Pyrewall] stop_firewall: failed to schedule final status refresh: {e}")
+    @pyqtSlot(bool)
+    def _on_started(self, ok: bool):
+        if not ok:
+            return
+        self._is_running = True
+        try:
+            self._set_status("Status: 🟢 Running", "color: green; font-weight: bold;")
+            log_general_history(self.username, "Firewall", "Started firewall")
+            self._show_msg("information", "Firewall", "✅ Firewall started successfully.")
+        except Exception as e:
+            print(f"[Pyrewall] _on_started error: {e}")
 
-        threading.Thread(target=_worker, daemon=True).start()
+    @pyqtSlot(bool)
+    def _on_stopped(self, ok: bool):
+        if not ok:
+            return
+        self._is_running = False
+        try:
+            self._set_status("Status: 🔴 Stopped", "color: red; font-weight: bold;")
+            log_general_history(self.username, "Firewall", "Stopped firewall")
+            self._show_msg("information", "Firewall", "🛑 Firewall stopped successfully.")
+        except Exception as e:
+            print(f"[Pyrewall] _on_stopped error: {e}")
+
+    @pyqtSlot(str, str, str)
+    def _show_msg(self, level: str, title: str, body: str):
+        """Show a message box; level is "information", "warning" or "critical".
+        Safe to queue from other threads via QMetaObject.invokeMethod."""
+        if level == "critical":
+            box = self._err_box
+            box.setWindowTitle(title)
+            box.setText(body)
+            box.exec()
+            return
+        _MSG_BOXES.get(level, QMessageBox.information)(self, title, body)
 
     # ---------------- LOGOUT ---------------- #
 
+    def closeEvent(self, event):
+        """Stop the device scanner with the window (logout closes it) so it doesn't keep
+        writing live_devices behind a hidden dashboard or outlive its tab."""
+        if self.network_tab is not None:
+            self.network_tab._stop_scanner()
+        super().closeEvent(event)
+
+    @pyqtSlot()
     def _on_logout_clicked(self):
         """Handler wired to the logout button only — asks confirmation then calls logout()."""
         resp = QMessageBox.question(
@@ -512,10 +601,7 @@ class HomePage(QWidget):
         )
         if resp != QMessageBox.StandardButton.Yes:
             # user cancelled — refresh UI state and return
-            try:
-                call_on_main(self._refresh_status_from_controller)
-            except Exception as e:
-                print(f"[Pyrewall] _on_logout_clicked: failed to schedule status refresh: {e}")
+            self._refresh_status_from_controller()
             return
 
         # user confirmed -> perform actual logout (non-confirming method)
@@ -526,8 +612,6 @@ class HomePage(QWidget):
 
     def logout(self):
         """Return to login without stopping the firewall (non-confirming)."""
-        from pyrewall.ui.login import LoginPage
-
         # Log to history (optional; keep if you want a record)
         try:
             log_general_history(self.username, "User", "Logged out")
@@ -537,7 +621,7 @@ class HomePage(QWidget):
         # close this window and show login page
         try:
             self.close()
-            self.login_window = LoginPage()
+            self.login_window = _get_login_page()()
             self.login_window.show()
         except Exception as e:
             print(f"[Pyrewall] ⚠️ logout error: {e}")
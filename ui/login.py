@@ -3,6 +3,14 @@ import sqlite3
 import json
 from pyrewall.db.paths import BASE_DIR  # ensure this is imported along with other pyrewall imports
 MARKER_FILE = os.path.join(BASE_DIR, "first_run.json")
+
+# First-run marker is read once at import (main imports this module after the install step);
+# sign_in clears it, so later LoginPages never touch the file.
+try:
+    with open(MARKER_FILE, "r", encoding="utf-8") as _mf:
+        _MARKER = json.load(_mf)
+except Exception:
+    _MARKER = None
 from PyQt6.QtWidgets import (
     QWidget, QLabel, QLineEdit, QPushButton, QMessageBox, QVBoxLayout, QHBoxLayout, QCheckBox)
 from PyQt6.QtCore import Qt, QEvent
@@ -12,6 +20,10 @@ from pyrewall.db.storage import log_general_history
 
 
 
+# scaled login logo, decoded on the first LoginPage and reused after logouts
+_LOGO_PIXMAP = None
+
+
 # Lazy import to avoid circular dependency later
 def import_homepage():
     from pyrewall.ui.dashboard import HomePage
@@ -31,13 +43,16 @@ class LoginPage(QWidget):
         left_layout = QVBoxLayout()
         left_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         logo_label = QLabel()
-        logo_path = os.path.join(os.path.dirname(__file__), "FFLogo.png")
-        logo_pixmap = QPixmap(logo_path)
-        if logo_pixmap.isNull():
-            print("[Pyrewall] ⚠️ Logo not found:", logo_path)
-        logo_label.setPixmap(
-            logo_pixmap.scaled(120, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-        )
+        global _LOGO_PIXMAP
+        if _LOGO_PIXMAP is None:
+            logo_path = os.path.join(os.path.dirname(__file__), "FFLogo.png")
+            logo_pixmap = QPixmap(logo_path)
+            if logo_pixmap.isNull():
+                print("[Pyrewall] ⚠️ Logo not found:", logo_path)
+            _LOGO_PIXMAP = logo_pixmap.scaled(
+                120, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+        logo_label.setPixmap(_LOGO_PIXMAP)
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         left_layout.addWidget(logo_label)
 
@@ -52,26 +67,21 @@ class LoginPage(QWidget):
 
         # --- One-time first-run credentials banner (if marker exists) ---
         self.first_run_banner = None
-        try:
-            if os.path.exists(MARKER_FILE):
-                try:
-                    with open(MARKER_FILE, "r", encoding="utf-8") as mf:
-                        m = json.load(mf)
-                    creds = m.get("credentials", {})
-                    uname = creds.get("username", "admin")
-                    pwd = creds.get("password", "password")
-                    banner_text = (f"First-time default admin credentials created:\n\n"
-                                   f"username: {uname}\npassword: {pwd}\n\n"
-                                   "Please log in and change the password in Settings.")
-                    self.first_run_banner = QLabel(banner_text)
-                    self.first_run_banner.setWordWrap(True)
-                    self.first_run_banner.setStyleSheet("background-color: #FFF9C4; padding:8px; border-radius:6px;")
-                    right_layout.addWidget(self.first_run_banner)
-                except Exception:
-                    # ignore marker read errors
-                    pass
-        except Exception:
-            pass
+        if _MARKER is not None:
+            try:
+                creds = _MARKER.get("credentials", {})
+                uname = creds.get("username", "admin")
+                pwd = creds.get("password", "password")
+                banner_text = (f"First-time default admin credentials created:\n\n"
+                               f"username: {uname}\npassword: {pwd}\n\n"
+                               "Please log in and change the password in Settings.")
+                self.first_run_banner = QLabel(banner_text)
+                self.first_run_banner.setWordWrap(True)
+                self.first_run_banner.setStyleSheet("background-color: #FFF9C4; padding:8px; border-radius:6px;")
+                right_layout.addWidget(self.first_run_banner)
+            except Exception:
+                # ignore malformed marker contents
+                pass
 
 
         self.username_input = QLineEdit()
@@ -146,11 +156,14 @@ class LoginPage(QWidget):
                 log_general_history(username, "Login Success", f"User login ({role})")
 
                 # If first-run marker exists, remove it now that the user logged in (so banner disappears next time).
-                try:
-                    if os.path.exists(MARKER_FILE):
+                global _MARKER
+                if _MARKER is not None:
+                    _MARKER = None
+                    try:
                         os.remove(MARKER_FILE)
-                except Exception:
-                    pass
+                    except OSError:
+                        # already gone (FileNotFoundError) or not removable; banner is off either way
+                        pass
 
                 self.open_home_page(username, role)
 
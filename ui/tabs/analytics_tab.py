@@ -1,12 +1,23 @@
-import os
-import sqlite3
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMessageBox
 from PyQt6.QtGui import QFont
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from pyrewall.db.connection import get_history_conn
 
-DB_PATH = "pyrewall/db/general_history.db"
+# matplotlib is heavy; imported on the first AnalyticsTab and kept afterwards
+_MPL = None
+
+def _mpl():
+    """(FigureCanvas, Figure), importing matplotlib on first use."""
+    global _MPL
+    if _MPL is None:
+        # the canvas class is imported directly, so no matplotlib.use() backend switch is needed
+        try:
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        except Exception:
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        _MPL = (FigureCanvas, Figure)
+    return _MPL
 
 
 class AnalyticsTab(QWidget):
@@ -21,6 +32,7 @@ class AnalyticsTab(QWidget):
         layout.addWidget(title)
 
         # Create figure and canvas for matplotlib
+        FigureCanvas, Figure = _mpl()
         self.figure = Figure(figsize=(6, 4))
         self.canvas = FigureCanvas(self.figure)
         layout.addWidget(self.canvas)
@@ -31,15 +43,14 @@ class AnalyticsTab(QWidget):
     def load_data_and_plot(self):
         """Load recent data and plot basic statistics."""
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
+            cur = get_history_conn().cursor()
+            # per-day counts are aggregated by SQLite; only <= 8 rows cross into Python
             cur.execute("""
-                SELECT timestamp, action FROM history
+                SELECT date(timestamp) AS d, COUNT(*) FROM history
                 WHERE timestamp >= datetime('now', '-7 days')
-                ORDER BY timestamp ASC
+                GROUP BY d ORDER BY d
             """)
             rows = cur.fetchall()
-            conn.close()
 
             if not rows:
                 self.figure.clear()
@@ -49,14 +60,7 @@ class AnalyticsTab(QWidget):
                 self.canvas.draw()
                 return
 
-            # Group actions per day
-            daily_actions = {}
-            for ts, action in rows:
-                date = ts.split(" ")[0]
-                daily_actions[date] = daily_actions.get(date, 0) + 1
-
-            dates = sorted(daily_actions.keys())
-            counts = [daily_actions[d] for d in dates]
+            dates, counts = zip(*rows)
 
             # --- Plot ---
             self.figure.clear()
@@ -1,16 +1,85 @@
 # pyrewall/ui/tabs/history_tab.py
 import os
+import re
 import sqlite3
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QPushButton,
+    QWidget, QVBoxLayout, QLabel, QListWidget, QListView, QPushButton,
     QHBoxLayout, QMessageBox, QLineEdit, QComboBox
 )
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QFileSystemWatcher, QTimer
 from datetime import datetime, timedelta
 from pyrewall.ui.button_styles import make_button
+from pyrewall.db.connection import HISTORY_WRITE_LOCK, get_history_conn
+from pyrewall.db.paths import GENERAL_HISTORY_DB as DB_PATH
+
+# fallback poll interval; WAL file change notifications drive the normal refreshes
+_POLL_MS = 5000
+
+# archived rows older than this are purged after each archive run
+ARCHIVE_RETENTION_DAYS = 90
+
+# external-content FTS5 index over history's text columns, kept in sync by triggers
+_FTS_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    username, action, description, content='history', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS history_fts_ai AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts(rowid, username, action, description)
+    VALUES (new.id, new.username, new.action, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS history_fts_ad AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts(history_fts, rowid, username, action, description)
+    VALUES ('delete', old.id, old.username, old.action, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS history_fts_au AFTER UPDATE ON history BEGIN
+    INSERT INTO history_fts(history_fts, rowid, username, action, description)
+    VALUES ('delete', old.id, old.username, old.action, old.description);
+    INSERT INTO history_fts(rowid, username, action, description)
+    VALUES (new.id, new.username, new.action, new.description);
+END;
+"""
+
+# Fixed SQL text for every query shape, so SQLite's statement cache hits on each call
+# and only bound parameters vary.
+_SQL_LOGS = {
+    order: f"SELECT username, action, description, timestamp FROM history ORDER BY timestamp {order} LIMIT 200"
+    for order in ("ASC", "DESC")
+}
+_SQL_TAIL = "SELECT id, username, action, description, timestamp FROM history WHERE id > ? ORDER BY id ASC LIMIT 200"
+_SQL_MAX_ID = "SELECT MAX(id) FROM history"
+
+_SEARCH_TEXT_SQL = {
+    "fts": "id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)",
+    "like": "(username LIKE ? ESCAPE '\\' OR action LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')",
+}
+
+# escapes LIKE wildcards (and the escape char itself) so user input matches literally
+_LIKE_ESCAPE = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
+def _search_sql(text_kind, dated, order):
+    clauses = [_SEARCH_TEXT_SQL[text_kind]] if text_kind else []
+    if dated:
+        clauses.append("(timestamp BETWEEN ? AND ?)")
+    where = " WHERE " + " AND ".join(clauses) if clauses else ""
+    return f"SELECT username, action, description, timestamp FROM history{where} ORDER BY timestamp {order} LIMIT 500"
+
+
+# (text_kind, dated, order) -> SQL
+_SQL_SEARCH = {
+    (kind, dated, order): _search_sql(kind, dated, order)
+    for kind in (None, "fts", "like") for dated in (False, True) for order in ("ASC", "DESC")
+}
+
+# YYYY-MM-DD / YYYY/MM/DD with optional [ Tt]HH:MM[:SS], 1-2 digit fields as strptime allows;
+# one match replaces five strptime attempts
+_DATE_RE = re.compile(r"^(\d{4})[-/](\d{1,2})[-/](\d{1,2})(?:[ Tt](\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?$")
+
+
+# list line for one history row (applied to sqlite3.Row via format_map)
+_FMT = "[{timestamp}] 👤 {username:<12} | ⚙️ {action:<15} | 📝 {description}"
 
-DB_PATH = "pyrewall/db/general_history.db"
 
 class HistoryTab(QWidget):
     """Displays system actions and event logs in real-time with search (archives are preserved)."""
@@ -19,6 +88,10 @@ class HistoryTab(QWidget):
         self.username = username
         self.role = role.lower().strip() if role else "user"
         self.last_count = 0
+        # PRAGMA data_version seen at the last refresh (bumped by other connections' commits)
+        self._last_data_version = None
+        # highest history.id already shown in the live view
+        self._max_seen_id = 0
 
         # ---------- UI Setup ----------
         layout = QVBoxLayout()
@@ -64,6 +137,9 @@ class HistoryTab(QWidget):
                 padding: 6px;
             }
         """)
+        # every row is one line of text: skip per-item size hints and lay out in batches
+        self.log_list.setUniformItemSizes(True)
+        self.log_list.setLayoutMode(QListView.LayoutMode.Batched)
         layout.addWidget(self.log_list)
         self.setLayout(layout)
 
@@ -71,22 +147,36 @@ class HistoryTab(QWidget):
         self._init_db()
         # connect sort changes AFTER UI creation to avoid triggering before ready
         self.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
-        self.load_logs(first=True)
+        self.load_logs()
+        # seed the change counter so the first tick doesn't re-read what was just loaded
+        try:
+            self._last_data_version = self._change_marker()
+        except Exception:
+            pass
 
-        # ---------- Timer for Instant Updates ----------
+        # ---------- Change notifications (WAL watcher + fallback timer) ----------
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.check_for_updates)
-        self.timer.start(1000)  # every 1 second
+        self.timer.start(_POLL_MS)
+
+        # every commit from another connection appends to the -wal file
+        self._watcher = QFileSystemWatcher(self)
+        wal_path = DB_PATH + "-wal"
+        if os.path.exists(wal_path):
+            self._watcher.addPath(wal_path)
+        self._watcher.fileChanged.connect(self._on_wal_changed)
 
     # ==========================================================
     # Database Setup
     # ==========================================================
     def _init_db(self):
-        """Ensure general_history and archive table exist."""
+        """Attach to the shared history connection and ensure general_history and archive table exist."""
+        self._conn = None
+        self._has_fts = False
         try:
-            os.makedirs(os.path.dirname(DB_PATH) or ".", exist_ok=True)
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
+            # process-wide autocommit connection (PRAGMAs applied there); archive opens its own transaction
+            self._conn = get_history_conn()
+            cur = self._conn.cursor()
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -108,11 +198,26 @@ class HistoryTab(QWidget):
                     archived_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.commit()
-            conn.close()
+            # ORDER BY / BETWEEN / archive cutoff all filter on timestamp
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_history_ts ON history(timestamp)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_archived_orig ON archived_history(orig_id)")
+            try:
+                existed = cur.execute("SELECT 1 FROM sqlite_master WHERE name = 'history_fts'").fetchone()
+                cur.executescript(_FTS_DDL)
+                if not existed:
+                    # index rows logged before the FTS table existed
+                    cur.execute("INSERT INTO history_fts(history_fts) VALUES ('rebuild')")
+                self._has_fts = True
+            except sqlite3.Error as e:
+                print(f"[Pyrewall] FTS5 unavailable, history search falls back to LIKE: {e}")
         except Exception as e:
             QMessageBox.critical(self, "Database Error", f"Failed to init history DB:\n{e}")
 
+    def closeEvent(self, event):
+        """Stop polling; the shared connection stays open for the rest of the app."""
+        self.timer.stop()
+        super().closeEvent(event)
+
     # ==========================================================
     # Auto Refresh Functions
     # ==========================================================
@@ -123,36 +228,69 @@ class HistoryTab(QWidget):
             return
 
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute("SELECT COUNT(*) FROM history")
-            count = cur.fetchone()[0] or 0
-            conn.close()
+            # O(1) change counters instead of a COUNT(*) scan every second
+            version = self._change_marker()
 
-            if count != self.last_count:
-                self.load_logs()
+            if version != self._last_data_version:
+                self._last_data_version = version
+                self._append_new_logs()
         except Exception:
             pass
 
+    def _change_marker(self):
+        """(data_version, total_changes): other connections' commits bump the first,
+        writes through the shared connection itself (e.g. log_general_history) the second."""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0], self._conn.total_changes
+
+    def _rows(self, sql, params=()):
+        """Run a read with name-addressable sqlite3.Row results (cursor-local: the connection is shared)."""
+        cur = self._conn.cursor()
+        cur.row_factory = sqlite3.Row
+        return cur.execute(sql, params).fetchall()
+
+    def _on_wal_changed(self, path):
+        # a checkpoint can truncate or recreate the file, which drops it from the watch list
+        if path not in self._watcher.files() and os.path.exists(path):
+            self._watcher.addPath(path)
+        self.check_for_updates()
+
+    def _append_new_logs(self):
+        """Fetch only rows newer than the last one shown and splice them into the live list."""
+        rows = self._rows(_SQL_TAIL, (self._max_seen_id,))
+        if not rows or len(rows) >= 200 or self.last_count == 0:
+            # deletions, large bursts or the empty placeholder: a full reload is simpler
+            self.load_logs()
+            return
+
+        self._max_seen_id = rows[-1]["id"]
+        lst = self.log_list
+        if self._current_order_sql() == "DESC":
+            # newest on top; drop the oldest rows off the bottom
+            lst.insertItems(0, [_FMT.format_map(r) for r in reversed(rows)])
+            while lst.count() > 200:
+                lst.takeItem(lst.count() - 1)
+        else:
+            # ascending view shows the oldest 200 rows; new rows only fill free slots
+            lst.addItems([_FMT.format_map(r) for r in rows[:max(0, 200 - lst.count())]])
+        self.last_count = lst.count()
+
     def _current_order_sql(self) -> str:
         """Return 'ASC' or 'DESC' according to sort_combo."""
         return "DESC" if self.sort_combo.currentText().lower().startswith("desc") else "ASC"
 
-    def load_logs(self, first=False, rows=None):
+    def load_logs(self, rows=None):
         """
         Load logs from the database into the list.
-        If 'rows' is provided, it will display those rows instead of querying DB (used by search).
+        If 'rows' is provided, it will display those rows instead of querying DB (used by search);
+        they must be sqlite3.Row-like mappings with username/action/description/timestamp.
         """
         try:
             order = self._current_order_sql()
 
             if rows is None:
-                conn = sqlite3.connect(DB_PATH)
-                cur = conn.cursor()
                 # use ORDER BY timestamp so chronological order is consistent; respect sort_combo
-                cur.execute(f"SELECT username, action, description, timestamp FROM history ORDER BY timestamp {order} LIMIT 200")
-                rows = cur.fetchall()
-                conn.close()
+                rows = self._rows(_SQL_LOGS[order])
+                self._max_seen_id = self._conn.execute(_SQL_MAX_ID).fetchone()[0] or 0
 
             # If rows were provided by search, they are already ordered by perform_search's ORDER clause.
             # If the caller provided rows but wishes to re-order according to the combo, we could sort them here,
@@ -166,24 +304,11 @@ class HistoryTab(QWidget):
 
             # If rows came from DB in ascending order (oldest first), we may want newest at top for 'descending' view
             # but since SQL already respected order, just display in given order.
-            for username, action, desc, ts in rows:
-                formatted = f"[{ts}] 👤 {username:<12} | ⚙️ {action:<15} | 📝 {desc}"
-                self.log_list.addItem(formatted)
+            self.log_list.addItems([_FMT.format_map(r) for r in rows])
 
             # update last_count only when showing live history (i.e. no active search)
             if not self.search_input.text().strip():
-                if first:
-                    self.last_count = len(rows)
-                else:
-                    # best-effort: refresh count value
-                    try:
-                        conn = sqlite3.connect(DB_PATH)
-                        cur = conn.cursor()
-                        cur.execute("SELECT COUNT(*) FROM history")
-                        self.last_count = cur.fetchone()[0] or 0
-                        conn.close()
-                    except Exception:
-                        self.last_count = len(rows)
+                self.last_count = len(rows)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load logs:\n{e}")
 
@@ -203,35 +328,39 @@ class HistoryTab(QWidget):
             cutoff_time = datetime.utcnow() - timedelta(minutes=1)
             cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
 
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-
-            # 1) select rows to archive
-            cur.execute(
-                "SELECT id, username, action, description, timestamp FROM history WHERE timestamp <= ?",
-                (cutoff_str,)
-            )
-            rows_to_archive = cur.fetchall()
-            if not rows_to_archive:
-                conn.close()
+            # HISTORY_WRITE_LOCK keeps other threads' log writes out of this transaction
+            with HISTORY_WRITE_LOCK:
+                cur = self._conn.cursor()
+                # take the write lock up front so the copy and the delete see one snapshot
+                cur.execute("BEGIN IMMEDIATE")
+                try:
+                    # 1) copy into archived_history server-side (preserve original id as orig_id)
+                    cur.execute(
+                        "INSERT INTO archived_history (orig_id, username, action, description, timestamp) "
+                        "SELECT id, username, action, description, timestamp FROM history WHERE timestamp <= ?",
+                        (cutoff_str,)
+                    )
+                    # 2) delete those rows from history (same cutoff, same transaction -> same rows)
+                    cur.execute("DELETE FROM history WHERE timestamp <= ?", (cutoff_str,))
+                    archived = cur.rowcount
+                    cur.execute("COMMIT")
+                except Exception:
+                    cur.execute("ROLLBACK")
+                    raise
+                # keep the archive bounded (separate statement: a failed purge must not undo the archive)
+                try:
+                    cur.execute(
+                        "DELETE FROM archived_history WHERE archived_at < datetime('now', ?)",
+                        (f"-{ARCHIVE_RETENTION_DAYS} days",)
+                    )
+                except sqlite3.Error as e:
+                    print(f"[Pyrewall] archived_history purge failed: {e}")
+
+            if archived <= 0:
                 QMessageBox.information(self, "Info", "No logs older than 1 minute found to archive.")
                 return
 
-            # 2) insert into archived_history (preserve original id as orig_id)
-            cur.executemany(
-                "INSERT INTO archived_history (orig_id, username, action, description, timestamp) VALUES (?, ?, ?, ?, ?)",
-                [(r[0], r[1], r[2], r[3], r[4]) for r in rows_to_archive]
-            )
-
-            # 3) delete those rows from history
-            ids = [r[0] for r in rows_to_archive]
-            placeholders = ",".join("?" for _ in ids)
-            cur.execute(f"DELETE FROM history WHERE id IN ({placeholders})", ids)
-
-            conn.commit()
-            conn.close()
-
-            QMessageBox.information(self, "Archived", f"🗄️ Archived {len(ids)} log(s) successfully.")
+            QMessageBox.information(self, "Archived", f"🗄️ Archived {archived} log(s) successfully.")
             self.load_logs()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to archive old logs:\n{e}")
@@ -251,7 +380,7 @@ class HistoryTab(QWidget):
         else:
             # empty -> resume and reload live logs
             if not self.timer.isActive():
-                self.timer.start(1000)
+                self.timer.start(_POLL_MS)
             self.load_logs()
 
     def _on_sort_changed(self, index):
@@ -285,6 +414,8 @@ class HistoryTab(QWidget):
           - "2025-11-29" (all logs on Nov 29 2025)
           - "2025-11-01..2025-11-10"
           - "login 2025-11-29"
+        Text is matched against word prefixes through the FTS index ("log" finds "login");
+        when that finds nothing, the search is re-run as a plain substring match ("ogin").
         """
         raw = self.search_input.text().strip()
         if not raw:
@@ -296,21 +427,21 @@ class HistoryTab(QWidget):
 
         # Detect date range syntax using '..'
         start_dt = end_dt = None
-        query_terms = raw
+        # free text left once date tokens are removed; empty -> date-only query, no LIKE scan
+        text_part = raw
 
         if ".." in raw:
             parts = [p.strip() for p in raw.split("..", 1)]
             start_dt = self._parse_date_flexible(parts[0])
             end_dt = self._parse_date_flexible(parts[1])
-            # remove parsed parts from query_terms if we can
-            # (user likely only wants date range, otherwise we keep full raw text too)
             if start_dt or end_dt:
-                query_terms = raw  # keep original to allow combined searches
+                # whichever side did not parse as a date is still matched as text
+                text_part = " ".join(p for p, dt in zip(parts, (start_dt, end_dt)) if dt is None and p)
         else:
             # try to find a single date token at start or end
             tokens = raw.split()
-            for t in (tokens[0], tokens[-1]) if tokens else []:
-                parsed = self._parse_date_flexible(t)
+            for pos in ((0, len(tokens) - 1) if tokens else ()):
+                parsed = self._parse_date_flexible(tokens[pos])
                 if parsed:
                     # single date provided: treat as that day (start..end of day) unless time included
                     if isinstance(parsed, tuple):
@@ -322,80 +453,82 @@ class HistoryTab(QWidget):
                         start_of_day = datetime(d.year, d.month, d.day, 0, 0, 0)
                         end_of_day = datetime(d.year, d.month, d.day, 23, 59, 59)
                         start_dt, end_dt = start_of_day, end_of_day
-                    # keep query_terms unchanged to still allow text search
+                    # the rest of the input (e.g. "login" in "login 2025-11-29") is still text-searched
+                    text_part = " ".join(tokens[:pos] + tokens[pos + 1:])
                     break
 
-        # Build SQL
-        sql = "SELECT username, action, description, timestamp FROM history"
-        where_clauses = []
+        # Pick the prebuilt SQL for this query shape; only params vary
+        text_kind = None
         params = []
-
-        # text matching across username/action/description (case-insensitive using LIKE)
-        like_term = f"%{raw.replace('%','\\%')}%"
-        where_clauses.append("(username LIKE ? OR action LIKE ? OR description LIKE ?)")
-        params.extend([like_term, like_term, like_term])
+        date_params = []
+
+        # text matching across username/action/description; skipped for date-only
+        # input so the timestamp index can range-scan alone
+        if text_part and self._has_fts:
+            # every word must prefix-match a token (quoted so FTS syntax in input is literal)
+            match = " ".join('"%s"*' % w.replace('"', '""') for w in text_part.split())
+            text_kind = "fts"
+            params.append(match)
+        elif text_part:
+            # case-insensitive substring fallback when FTS5 is not compiled in
+            text_kind = "like"
+            params.extend(self._like_params(text_part))
 
         # if we detected date range, add timestamp constraints
-        if start_dt is not None or end_dt is not None:
+        dated = start_dt is not None or end_dt is not None
+        if dated:
             # ensure we have explicit bounds
             if start_dt is None:
                 start_dt = datetime(1970, 1, 1)
             if end_dt is None:
                 end_dt = datetime.utcnow()
-            where_clauses.append("(timestamp BETWEEN ? AND ?)")
-            params.append(start_dt.strftime("%Y-%m-%d %H:%M:%S"))
-            params.append(end_dt.strftime("%Y-%m-%d %H:%M:%S"))
-
-        if where_clauses:
-            sql += " WHERE " + " AND ".join(where_clauses)
+            date_params = [start_dt.strftime("%Y-%m-%d %H:%M:%S"), end_dt.strftime("%Y-%m-%d %H:%M:%S")]
+            params.extend(date_params)
 
-        sql += f" ORDER BY timestamp {order} LIMIT 500"
+        sql = _SQL_SEARCH[(text_kind, dated, order)]
 
         # Execute query and display results
         try:
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute(sql, params)
-            rows = cur.fetchall()
-            conn.close()
+            rows = self._rows(sql, params)
+            if not rows and text_kind == "fts":
+                # FTS only matches word prefixes; keep substring hits like "ogin" -> "login"
+                rows = self._rows(_SQL_SEARCH[("like", dated, order)], self._like_params(text_part) + date_params)
 
             # show results (pause auto refresh while search active - ensured elsewhere)
             self.load_logs(rows=rows)
         except Exception as e:
             QMessageBox.critical(self, "Search Error", f"Failed to perform search:\n{e}")
 
+    @staticmethod
+    def _like_params(text):
+        """Bound values for the three-column LIKE clause (wildcards in text match literally)."""
+        like_term = f"%{text.translate(_LIKE_ESCAPE)}%"
+        return [like_term, like_term, like_term]
+
     def _parse_date_flexible(self, token):
         """
         Try parsing a token as a date or datetime.
         Returns:
-          - a datetime object (date parsed),
-          - OR a tuple (start_dt, end_dt) if token looked like a date-only and should expand to a range,
-          - OR None if parsing failed.
+          - a datetime object (midnight for a date-only token; the caller expands that to the day),
+          - OR None if the token is not a date or a field is out of range.
         Accepts formats:
           YYYY-MM-DD
           YYYY/MM/DD
           YYYY-MM-DDTHH:MM
           YYYY-MM-DD HH:MM
           YYYY-MM-DD HH:MM:SS
+        Month, day and time fields may be one or two digits, '-' and '/' may be mixed, the
+        date/time separator may be a space, 'T' or 't', and seconds are optional after 'T'
+        as well (the same shapes the old '/'->'-', 't'->'T' + strptime parsing accepted).
         """
-        if not token or token.lower() in ("and", "to"):
+        if not token:
+            return None
+        m = _DATE_RE.match(token)
+        if m is None:
+            return None
+        # date-only tokens come back at midnight; the caller expands them to the whole day
+        try:
+            return datetime(*(int(g) for g in m.groups() if g is not None))
+        except ValueError:
+            # out-of-range month/day/time
             return None
-        # normalize separators
-        t = token.replace("/", "-").replace("t", "T")
-        fmts = [
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d"
-        ]
-        for f in fmts:
-            try:
-                dt = datetime.strptime(t, f)
-                # if format is date-only, return that date to be expanded by caller
-                if f == "%Y-%m-%d":
-                    return dt
-                return dt
-            except Exception:
-                continue
-        return None
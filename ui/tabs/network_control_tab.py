@@ -1,91 +1,149 @@
 # network_control_tab.py
+import asyncio
+import atexit
+import ctypes
 import os
+import pathlib
+import pickle
+import random
 import re
 import threading
 import time
+import socket
 import sqlite3
 import subprocess
-import shlex
+import sys
 import csv
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
+from urllib.parse import urlsplit
 from PyQt6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QListWidget, QListWidgetItem, QLineEdit,
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QListWidget, QLineEdit, QFileDialog,
     QPushButton, QMessageBox, QFormLayout, QComboBox, QGridLayout, QFrame,
-    QAbstractItemView, QSizePolicy
+    QAbstractItemView, QSizePolicy, QApplication
 )
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt6.QtCore import QMetaObject, QObject, QTimer, Qt, QThread, Q_ARG, pyqtSignal, pyqtSlot
 from pyrewall.ui.button_styles import make_button
 
-# Try to reuse the project's GraphWidget if present; otherwise provide a fallback.
-try:
-    from pyrewall.ui.components.graph_widget import GraphWidget
-except Exception:
-    try:
-        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+# matplotlib/numpy (via the project's GraphWidget or the fallback below) are only imported
+# when the traffic graph is first built, not when this module is imported.
+_MPL = None
+
+def _mpl():
+    """(FigureCanvas, Figure, numpy), importing them on first use."""
+    global _MPL
+    if _MPL is None:
+        try:
+            from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        except Exception:
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
         from matplotlib.figure import Figure
-        from PyQt6.QtWidgets import QVBoxLayout
-    except Exception:
-        class GraphWidget(QWidget):
-            def __init__(self, title="Traffic Graph"):
-                super().__init__()
-                lbl = QLabel(title)
-                layout = QVBoxLayout(self)
-                layout.addWidget(lbl)
-            def update_graph(self, data):
-                pass
-    else:
-        class GraphWidget(QWidget):
-            def __init__(self, title="Traffic Graph"):
-                super().__init__()
-                layout = QVBoxLayout(self)
-                layout.setContentsMargins(0, 0, 0, 0)
-                layout.setSpacing(0)
-                self.figure = Figure(figsize=(4, 2))
-                self.canvas = FigureCanvas(self.figure)
-                layout.addWidget(self.canvas)
-                self._title = title
-                self._ax = self.figure.add_subplot(111)
-                self._ax.set_title(self._title)
-                self._ax.grid(True)
-                self.canvas.draw()
-            def update_graph(self, data):
+        import numpy as np
+        _MPL = (FigureCanvas, Figure, np)
+    return _MPL
+
+
+class _PlaceholderGraph(QWidget):
+    """Title-only stand-in when matplotlib isn't available."""
+    def __init__(self, title="Traffic Graph"):
+        super().__init__()
+        lbl = QLabel(title)
+        layout = QVBoxLayout(self)
+        layout.addWidget(lbl)
+    def update_graph(self, data):
+        pass
+
+
+class _FallbackGraph(QWidget):
+    """Minimal single-series graph used when pyrewall.ui.components.graph_widget can't be imported."""
+    def __init__(self, title="Traffic Graph"):
+        super().__init__()
+        FigureCanvas, Figure, np = _mpl()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        self.figure = Figure(figsize=(4, 2))
+        self.canvas = FigureCanvas(self.figure)
+        layout.addWidget(self.canvas)
+        self._title = title
+        # x indices shared by every update; sliced per call and only regrown for longer series
+        self._x_cache = np.arange(60, dtype=np.int32)
+        # axes, line and placeholder are built once; updates only swap the line data
+        self._ax = self.figure.add_subplot(111)
+        self._ax.set_title(self._title)
+        self._ax.grid(True)
+        self._ax.set_xlabel("Samples")
+        self._ax.set_ylabel("Value")
+        (self._line,) = self._ax.plot([], [], label="Traffic")
+        self._ax.legend(loc="upper right")
+        self._empty = self._ax.text(0.5, 0.5, "No data", ha="center", va="center",
+                                    fontsize=10, color="gray", transform=self._ax.transAxes)
+        self.figure.tight_layout()
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        try:
+            self.figure.tight_layout()
+        except Exception:
+            pass
+    def update_graph(self, data):
+        try:
+            if not data:
+                self._line.set_data([], [])
+                self._empty.set_visible(True)
+            else:
+                np = _mpl()[2]
                 try:
-                    self.figure.clear()
-                    ax = self.figure.add_subplot(111)
-                    ax.grid(True)
-                    if not data:
-                        ax.text(0.5, 0.5, "No data", ha="center", va="center", fontsize=10, color="gray")
-                    else:
-                        try:
-                            x = list(range(len(data)))
-                            y = [float(v) for v in data]
-                        except Exception:
-                            x = list(range(len(data)))
-                            y = [0 for _ in data]
-                        ax.plot(x, y, label="Traffic")
-                        ax.set_xlabel("Samples")
-                        ax.set_ylabel("Value")
-                        ax.legend(loc="upper right")
-                    self.figure.tight_layout()
-                    self.canvas.draw_idle()
-                except Exception as e:
-                    print(f"[GraphWidget] update error: {e}")
+                    y = np.asarray(data, dtype=np.float32)
+                except (TypeError, ValueError):
+                    y = np.zeros(len(data), dtype=np.float32)
+                if y.size > self._x_cache.size:
+                    self._x_cache = np.arange(max(y.size, 2 * self._x_cache.size), dtype=np.int32)
+                self._line.set_data(self._x_cache[:y.size], y)
+                self._empty.set_visible(False)
+                self._ax.relim()
+                self._ax.autoscale_view()
+            self.canvas.draw_idle()
+        except Exception as e:
+            print(f"[GraphWidget] update error: {e}")
+
+
+def _make_graph_widget(title):
+    """Reuse the project's GraphWidget if present; otherwise provide a fallback."""
+    try:
+        from pyrewall.ui.components.graph_widget import GraphWidget
+    except Exception:
+        try:
+            _mpl()
+        except Exception:
+            return _PlaceholderGraph(title)
+        return _FallbackGraph(title)
+    return GraphWidget(title)
 
 # ------------------- SAFE IMPORTS (Defensive) -------------------
 try:
     from pyrewall.core.firewall_thread import (
-        add_blocked_domain, remove_blocked_domain,
+        add_blocked_domain, add_blocked_domains_bulk, remove_blocked_domain,
         reload_blocked_domains, sync_blocked_ips,
-        notify_firewall_reload
+        notify_firewall_reload, match_blocked_suffix
     )
 except Exception as e:
     print("[NetworkControl] ⚠️ firewall_thread import failed:", e)
     def add_blocked_domain(domain, db_path=None): raise RuntimeError("firewall_thread missing")
+    def add_blocked_domains_bulk(domains, db_path=None): raise RuntimeError("firewall_thread missing")
     def remove_blocked_domain(domain, db_path=None): raise RuntimeError("firewall_thread missing")
     def reload_blocked_domains(db_path=None): return []
     def sync_blocked_ips(db_path=None): pass
     def notify_firewall_reload(): pass
+    def match_blocked_suffix(host, suffixes):
+        while host:
+            if host in suffixes:
+                return host
+            _, dot, host = host.partition(".")
+            if not dot:
+                return None
+        return None
 
 # App signatures
 try:
@@ -115,11 +173,31 @@ except Exception as e:
 
 # Logging
 from pyrewall.db.storage import log_general_history
+from pyrewall.db.connection import open_firewall_db
 from pyrewall.db.paths import FIREWALL_DB as DEFAULT_DB
 
 # Use the exact same DB path as the firewall thread
 DB_PATH = DEFAULT_DB
 
+# optional http(s) scheme, then the host up to the first port/path/query/fragment delimiter;
+# the lookahead rejects hosts followed by anything else (e.g. embedded whitespace)
+_URL_RE = re.compile(r"^(?:https?://)?([^/?#:\s]+)(?=[/?#:]|$)", re.I)
+# URL parsers ignore tab/CR/LF anywhere in the input (WHATWG); NUL, VT, FF and spaces
+# never belong in a hostname either, so they go in the same single translate pass
+_BAD_CHARS = str.maketrans("", "", "\t\r\n\x00\x0b\x0c ")
+# RFC 1123 hostname with at least two labels: 63-char labels that don't start/end with '-',
+# 253 chars total, alphabetic (or punycode) TLD; linear, no nested unbounded quantifiers
+_HOST_RE = re.compile(
+    r"(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})"
+)
+# end of the authority component (start of path, query or fragment)
+_AUTHORITY_END_RE = re.compile(r"[/?#]")
+# separators for pasting several domains into the input at once
+_MULTI_SPLIT_RE = re.compile(r"[\s,;]+")
+
+# pure function of its input; list rebuilds and duplicate checks re-normalize the same strings.
+# Call _normalize_domain.cache_clear() if the parsing rules above are ever changed at runtime.
+@functools.lru_cache(maxsize=4096)
 def _normalize_domain(raw: str) -> str | None:
     """
     Take user input like:
@@ -133,55 +211,282 @@ def _normalize_domain(raw: str) -> str | None:
     """
     if not raw:
         return None
-    s = raw.strip().lower()
+    raw = raw.translate(_BAD_CHARS)
+    scheme, sep, rest = raw.partition("://")
+    authority = _AUTHORITY_END_RE.split(rest if sep else raw, 1)[0]
+    if (sep and scheme.lower() not in ("http", "https")) or "@" in authority or "[" in authority:
+        # other schemes, userinfo and IPv6 literals are left to urlsplit
+        return _finish_host(_urlsplit_host(raw))
+
+    m = _URL_RE.match(raw)
+    if m is None:
+        return _finish_host(_urlsplit_host(raw)) if sep else None
+    host = _finish_host(m.group(1))
+    # slow path when the regex capture isn't a valid hostname
+    return host if host is not None else _finish_host(_urlsplit_host(raw))
+
+
+def _urlsplit_host(raw: str) -> str | None:
+    """Hostname as urlsplit sees it; scheme-less input is parsed as a network-path reference."""
+    try:
+        return urlsplit(raw if "://" in raw else "//" + raw).hostname
+    except ValueError:
+        return None
 
-    # Strip scheme
-    if s.startswith("http://") or s.startswith("https://"):
-        s = s.split("://", 1)[1]
 
-    # Strip path, query, fragment
-    for sep in ["/", "?", "#"]:
-        if sep in s:
-            s = s.split(sep, 1)[0]
+def _finish_host(host: str | None) -> str | None:
+    """Lower-case, strip leading/trailing dots and validate against _HOST_RE."""
+    if not host:
+        return None
+    s = host.lower().strip(".")
+    return s if _HOST_RE.fullmatch(s) else None
 
-    # Strip port if present
-    if ":" in s:
-        s = s.split(":", 1)[0]
 
-    # Strip leading/trailing dots and spaces
-    s = s.strip().strip(".")
+def _connect(db_path=DB_PATH):
+    """
+    Open a connection whose lock waits happen inside SQLite's busy handler (timeout=30 s)
+    rather than bouncing OperationalError up to Python.
+    """
+    return open_firewall_db(db_path, timeout=30)
 
-    # Basic sanity
-    if not s or " " in s or "." not in s:
-        return None
 
-    return s
+# primary result codes worth retrying (module constants exist on 3.11+)
+_RETRY_CODES = (getattr(sqlite3, "SQLITE_BUSY", 5), getattr(sqlite3, "SQLITE_LOCKED", 6))
 
 
-def db_retry(fn, retries=5, delay=0.15):
-    for _ in range(retries):
+def _is_lock_error(e):
+    code = getattr(e, "sqlite_errorcode", None)
+    if code is not None:
+        # mask off extended codes such as SQLITE_BUSY_SNAPSHOT
+        return (code & 0xFF) in _RETRY_CODES
+    # Python < 3.11: no error code on the exception
+    return "locked" in str(e).lower()
+
+
+def db_retry(fn, retries=10, base_ms=1, cap_ms=100):
+    """
+    Call fn(), retrying while SQLite reports the database locked.
+    Connections from _connect() already wait in the busy handler; this only covers the
+    cases SQLite reports immediately (e.g. lock upgrades it refuses to wait on).
+    Backoff is exponential with full jitter: sleep uniform(0, min(cap_ms, base_ms * 2**attempt)) ms,
+    so brief contention clears in about a millisecond and concurrent retriers don't wake together.
+    """
+    for attempt in range(retries):
         try:
             return fn()
         except sqlite3.OperationalError as e:
-            if "locked" in str(e).lower():
-                time.sleep(delay)
+            if _is_lock_error(e):
+                time.sleep(random.uniform(0, min(cap_ms, base_ms * (1 << attempt))) / 1000.0)
                 continue
             raise
     raise RuntimeError("DB remained locked after retries")
 
+
+# icmplib is optional; without it liveness checks fall back to one ping.exe per IP
+try:
+    from icmplib import async_multiping as _icmp_async_multiping
+except Exception:
+    _icmp_async_multiping = None
+
+# argv for reading the ARP table (Windows `arp -a`); run directly, never through a shell
+_ARP_CMD = ("arp", "-a")
+# don't give each ping/arp child a console of its own (0 off Windows)
+_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+# `arp -a` row on the ICS hotspot subnet: IP, then MAC
+_ARP_SUBNET = "192.168.137."
+_ARP_RE = re.compile(r"(192\.168\.137\.\d+)\s+([0-9A-Fa-f:-]{11,})")
+# blocked-devices rows start with the IPv4 address
+_IPV4_PREFIX_RE = re.compile(r"\d+\.\d+\.\d+\.\d+")
+
+# MAC normalization in one translate pass each:
+#   _MAC_LOWER:     "AA-BB-..." -> "aa:bb:..." (display / grouping form)
+#   _MAC_HEX_UPPER: "aa:bb-..." -> "AABB..."   (bare hex, fed to bytes.fromhex)
+_MAC_LOWER = str.maketrans("-ABCDEF", ":abcdef")
+_MAC_HEX_UPPER = str.maketrans("abcdef", "ABCDEF", ":-")
+
+
+def _oui_key(hexprefix):
+    """vendor_db key for a bare hex prefix: raw bytes, odd nibble counts (MA-M/MA-S) zero-padded."""
+    return bytes.fromhex(hexprefix + "0" * (len(hexprefix) & 1))
+
+
+def _index_ouis(hex_db):
+    """{hex prefix: vendor} -> ({bytes key: vendor}, nibble lengths present, longest first)."""
+    db = {}
+    lengths = set()
+    for oui, vendor in hex_db.items():
+        try:
+            db[_oui_key(oui)] = vendor
+        except ValueError:
+            continue
+        lengths.add(len(oui))
+    return db, tuple(sorted(lengths, reverse=True)) or (6,)
+
+# iphlpapi.GetIpNetTable structures (Windows); lets the scanner read the ARP table without
+# spawning `arp -a`
+class _MIB_IPNETROW(ctypes.Structure):
+    _fields_ = [
+        ("dwIndex", ctypes.c_uint32),
+        ("dwPhysAddrLen", ctypes.c_uint32),
+        ("bPhysAddr", ctypes.c_ubyte * 8),
+        ("dwAddr", ctypes.c_uint32),  # network byte order
+        ("dwType", ctypes.c_uint32),
+    ]
+
+_ERROR_INSUFFICIENT_BUFFER = 122
+_ERROR_NO_DATA = 232
+_MIB_IPNET_TYPE_INVALID = 2
+# 192.168.137.0/24 as dwAddr reads it on little-endian hosts (first octet in the low byte)
+_HOTSPOT_NET, _HOTSPOT_MASK = 0x0089A8C0, 0x00FFFFFF
+
+
+def _arp_table_native():
+    """
+    [(ip, mac)] for the hotspot subnet via GetIpNetTable, MACs formatted like `arp -a`
+    (aa-bb-cc-dd-ee-ff). Returns None off Windows or if the call fails, so the caller
+    can fall back to parsing `arp -a`.
+    """
+    if sys.platform != "win32":
+        return None
+    try:
+        get_table = ctypes.windll.iphlpapi.GetIpNetTable
+        size = ctypes.c_ulong(0)
+        ret = get_table(None, ctypes.byref(size), False)
+        if ret == _ERROR_NO_DATA:
+            return []
+        if ret != _ERROR_INSUFFICIENT_BUFFER:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if get_table(buf, ctypes.byref(size), False) != 0:
+            return None
+        n = ctypes.c_uint32.from_buffer(buf).value
+        rows = (_MIB_IPNETROW * n).from_buffer(buf, ctypes.sizeof(ctypes.c_uint32))
+        pairs = []
+        for r in rows:
+            if (r.dwAddr & _HOTSPOT_MASK) != _HOTSPOT_NET or r.dwType == _MIB_IPNET_TYPE_INVALID:
+                continue
+            if not r.dwPhysAddrLen:
+                continue
+            ip = socket.inet_ntoa(r.dwAddr.to_bytes(4, "little"))
+            mac = "-".join(f"{b:02x}" for b in r.bPhysAddr[:r.dwPhysAddrLen])
+            pairs.append((ip, mac))
+        return pairs
+    except Exception as e:
+        print(f"[devices] GetIpNetTable failed, falling back to arp -a: {e}")
+        return None
+
+
+# one small pool for this tab's background DB writes, reused instead of a Thread per click
+_BG_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="netctl")
+
+# device scan cadence: the gap between the end of one scan and the start of the next;
+# back off by _SCAN_BACKOFF while the set of IPs stays the same, snap back to the base
+# interval as soon as it changes
+_SCAN_BASE_MS = 3000
+_SCAN_MAX_MS = 30000
+_SCAN_BACKOFF = 1.5
+
+# one read-only connection shared by the list reloads, instead of a fresh open per refresh
+_ro_conn = None
+_ro_lock = threading.Lock()
+
+
+def _get_conn():
+    """Return the shared read-only connection to DB_PATH, or None while the file doesn't exist yet."""
+    global _ro_conn
+    with _ro_lock:
+        if _ro_conn is None:
+            path = os.path.abspath(DB_PATH)
+            if not os.path.exists(path):
+                return None
+            try:
+                _ro_conn = sqlite3.connect(
+                    pathlib.Path(path).as_uri() + "?mode=ro",
+                    uri=True, timeout=30, check_same_thread=False,
+                )
+            except sqlite3.Error as e:
+                print(f"[NetworkControl] read-only DB open failed: {e}")
+                return None
+        return _ro_conn
+
+
+def _read_rows(sql):
+    """
+    Run a SELECT on the shared read-only connection.
+    Returns None on any SQLite error (e.g. table not created yet) so callers fall back
+    to the owning module's helper, which also creates the schema.
+    """
+    conn = _get_conn()
+    if conn is None:
+        return None
+    try:
+        with _ro_lock:
+            return conn.execute(sql).fetchall()
+    except sqlite3.Error:
+        return None
+
+
+def _close_conn():
+    global _ro_conn
+    with _ro_lock:
+        conn, _ro_conn = _ro_conn, None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+atexit.register(_close_conn)
+
 # ============================================================
 # BACKGROUND THREAD — DEVICE SCANNER (from old DevicesTab)
 # ============================================================
-class DeviceScanner(QThread):
-    """Background worker that scans local network and identifies device vendors/types."""
+class DeviceScanner(QObject):
+    """
+    Background worker that scans local network and identifies device vendors/types.
+    One instance lives on a dedicated QThread for the tab's lifetime; each scan is a
+    queued do_scan() call.
+    """
     devices_found = pyqtSignal(list)
+    # (ip, mac, vendor, dev_type) as soon as each device is verified; devices_found still
+    # follows with the complete, sorted list
+    device_found_one = pyqtSignal(tuple)
     scan_error = pyqtSignal(str)
+    # emitted after every do_scan(), whatever the outcome
+    scan_finished = pyqtSignal()
 
     # 🧩 Class-level vendor database (shared by all instances)
+    # keys are raw prefix bytes (see _oui_key); oui_lengths lists the prefix lengths present
+    # in hex digits, longest first, so MA-S (9) / MA-M (7) / MA-L (6) match most-specific-first
     vendor_db = {}
+    oui_lengths = (6,)
+
+    # last ARP snapshot and the devices it produced: an identical table seen within
+    # _ARP_REUSE_S of the last full sweep reuses that result instead of pinging again
+    _ARP_REUSE_S = 30.0
+    _last_arp_key = None
+    _last_devices = None
+    _last_sweep = 0.0
+
+    # ip -> (monotonic time of last probe, alive); shared by every scanner instance
+    _ping_cache = {}
+    _PING_TTL_S = 5.0
+    _PING_EVICT_S = 30.0
+
+    # per-probe wait; LAN replies come back in a few ms, so stale ARP entries fail fast
+    _PING_TIMEOUT_MS = 150
+
+    # mac -> (ip, monotonic time it was last verified by ping)
+    _alive_cache = {}
+    _ALIVE_TTL_S = 10.0
 
     def __init__(self):
         super().__init__()
+        # set per scan: always do the full ping sweep (manual "Scan Now")
+        self._force = False
+        # event loop for the icmplib sweep, created on the worker thread and reused every scan
+        self._loop = None
         # Load the vendor DB once when the first scanner runs
         if not DeviceScanner.vendor_db:
             DeviceScanner.load_vendor_db()
@@ -197,78 +502,192 @@ class DeviceScanner(QThread):
         if not os.path.exists(vendor_file):
             print("[Pyrewall] ⚠️ Vendor file not found — creating minimal fallback.")
             # Minimal fallback in case CSV is missing
-            cls.vendor_db = {
-                "00:1A:2B": "Apple",
-                "00:1B:63": "HP",
-                "00:25:9C": "Samsung",
-                "F4:5C:89": "Xiaomi",
-                "3C:5A:B4": "ASUS",
-            }
+            cls._set_vendor_db(*_index_ouis({
+                "001A2B": "Apple",
+                "001B63": "HP",
+                "00259C": "Samsung",
+                "F45C89": "Xiaomi",
+                "3C5AB4": "ASUS",
+            }))
             return
 
+        # indexed table cached next to the CSV; reused while it's at least as new as the CSV
+        # (".v2": keys are bytes now, older str-keyed caches are ignored)
+        cache_path = vendor_file + ".v2.pkl"
         try:
-            with open(vendor_file, "r", encoding="utf-8") as f:
-                for row in csv.reader(f):
-                    if len(row) >= 2:
-                        oui = row[0].strip().upper()
-                        vendor = row[1].strip()
-                        if oui and vendor:
-                            cls.vendor_db[oui] = vendor
+            if os.path.getmtime(cache_path) >= os.path.getmtime(vendor_file):
+                with open(cache_path, "rb") as f:
+                    db, lengths = pickle.load(f)
+                cls._set_vendor_db(db, lengths)
+                print(f"[Pyrewall] ✅ Loaded {len(cls.vendor_db)} MAC vendors (cached).")
+                return
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+            pass
+
+        try:
+            # one read + decode, then plain str splits; only quoted lines (vendor names
+            # containing commas) need the csv module
+            with open(vendor_file, "rb") as f:
+                text = f.read().decode("utf-8", errors="ignore")
+            db = {}
+            quoted = []
+            for line in text.splitlines():
+                if '"' in line:
+                    quoted.append(line)
+                    continue
+                oui, _, rest = line.partition(",")
+                vendor = rest.partition(",")[0].strip()
+                oui = oui.strip().translate(_MAC_HEX_UPPER)
+                if oui and vendor:
+                    db[oui] = vendor
+            for row in csv.reader(quoted):
+                if len(row) >= 2:
+                    oui = row[0].strip().translate(_MAC_HEX_UPPER)
+                    vendor = row[1].strip()
+                    if oui and vendor:
+                        db[oui] = vendor
+            db, lengths = _index_ouis(db)
+            cls._set_vendor_db(db, lengths)
             print(f"[Pyrewall] ✅ Loaded {len(cls.vendor_db)} MAC vendors.")
+            try:
+                tmp = cache_path + ".tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump((db, lengths), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except OSError as e:
+                print(f"[Pyrewall] vendor cache not written: {e}")
         except Exception as e:
             print(f"[Pyrewall] ⚠️ Failed to load MAC vendor database: {e}")
 
+    @classmethod
+    def _set_vendor_db(cls, db, lengths):
+        cls.vendor_db = db
+        cls.oui_lengths = lengths
+        _vendor_and_type.cache_clear()
+
     # ============================================================
     # 🔍 Vendor + Type Detection (Dynamic)
     # ============================================================
     def _lookup_vendor_and_type(self, mac):
         """Return vendor and inferred device type based on MAC prefix."""
-        prefix = mac.upper().replace("-", ":")[:8]
-        vendor = self.vendor_db.get(prefix, "Unknown Vendor")
-
-        # 🧠 Infer device type by known vendor
-        v_upper = vendor.upper()
-        if any(x in v_upper for x in ["SAMSUNG", "OPPO", "VIVO", "XIAOMI", "HUAWEI"]):
-            dev_type = "Android Phone"
-        elif "APPLE" in v_upper:
-            dev_type = "iPhone / Mac"
-        elif any(x in v_upper for x in ["DELL", "HP", "LENOVO", "ASUS", "ACER", "MSI"]):
-            dev_type = "Laptop / PC"
-        elif "TP-LINK" in v_upper or "TCL" in v_upper or "REALME" in v_upper:
-            dev_type = "Router / IoT"
-        else:
-            dev_type = "Unknown Device"
-
-        return vendor, dev_type
+        return _vendor_and_type(mac)
 
     # ============================================================
     # 🧪 Small helper: check if an IP is really alive (Windows ping)
     # ============================================================
-    def _ping_ip(self, ip, timeout_ms: int = 400) -> bool:
+    def _ping_ip(self, ip, timeout_ms: int = _PING_TIMEOUT_MS) -> bool:
         """
         Return True if the host responds to a single ping within timeout_ms.
-        Windows syntax:
-          ping -n 1 -w <timeout_ms> <ip>
+        Windows syntax (1-byte payload, don't fragment):
+          ping -n 1 -w <timeout_ms> -l 1 -f <ip>
         """
         try:
             result = subprocess.run(
-                ["ping", "-n", "1", "-w", str(timeout_ms), ip],
+                ["ping", "-n", "1", "-w", str(timeout_ms), "-l", "1", "-f", ip],
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                creationflags=_NO_WINDOW,
             )
             return result.returncode == 0
         except Exception as e:
             print(f"[devices] ping failed for {ip}: {e}")
             return False
 
+    def _sweep_ping(self, ips, timeout_ms: int = _PING_TIMEOUT_MS) -> dict:
+        """
+        Return {ip: alive} for all ips. Results younger than _PING_TTL_S are reused from
+        _ping_cache (unless this is a forced scan); only the rest are probed.
+        """
+        now = time.monotonic()
+        cache = DeviceScanner._ping_cache
+        result, todo = {}, []
+        for ip in ips:
+            hit = None if self._force else cache.get(ip)
+            if hit is not None and now - hit[0] < self._PING_TTL_S:
+                result[ip] = hit[1]
+            else:
+                todo.append(ip)
+
+        fresh = self._probe(todo, timeout_ms)
+        for ip, ok in fresh.items():
+            cache[ip] = (now, ok)
+        result.update(fresh)
+
+        # drop entries for IPs that haven't been seen in a while
+        for ip in [ip for ip, (ts, _) in cache.items() if now - ts > self._PING_EVICT_S]:
+            del cache[ip]
+        return result
+
+    def _probe(self, ips, timeout_ms):
+        """
+        Ping ips now and return {ip: alive}.
+        With icmplib: one unprivileged ICMP socket sends every echo and collects the replies.
+        Otherwise (or if the socket can't be opened) _ping_ip runs concurrently on a thread pool.
+        """
+        if not ips:
+            return {}
+        if _icmp_async_multiping is not None:
+            try:
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                hosts = self._loop.run_until_complete(
+                    _icmp_async_multiping(ips, count=1, timeout=timeout_ms / 1000.0, privileged=False)
+                )
+                return {h.address: h.is_alive for h in hosts}
+            except Exception as e:
+                print(f"[devices] icmplib sweep failed, falling back to ping.exe: {e}")
+        with ThreadPoolExecutor(max_workers=min(64, len(ips))) as ex:
+            return dict(zip(ips, ex.map(lambda ip: self._ping_ip(ip, timeout_ms), ips)))
+
     # ============================================================
     # 🛰️ Main Network Scan (ARP only + ping, 1 row per real device)
     # ============================================================
-    def run(self):
+    def _read_arp(self):
+        """[(ip, mac)] for 192.168.137.x: GetIpNetTable when available, else parse `arp -a`."""
+        pairs = _arp_table_native()
+        if pairs is not None:
+            return pairs
+        output = subprocess.run(
+            _ARP_CMD, capture_output=True, text=True, encoding="utf-8",
+            errors="ignore", timeout=5, check=True, creationflags=_NO_WINDOW,
+        ).stdout
+        pairs = []
+        for line in output.splitlines():
+            # cheap substring pre-filter; the regex only runs on hotspot-subnet rows
+            if _ARP_SUBNET not in line:
+                continue
+            m = _ARP_RE.search(line)
+            if m is not None:
+                pairs.append(m.groups())
+        return pairs
+
+    def close_loop(self):
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def _report(self, devices, ip, mac_norm):
+        """Add a verified device to this scan's result and stream it to the UI."""
+        vendor, dev_type = self._lookup_vendor_and_type(mac_norm)
+        dev = (ip, mac_norm.upper(), vendor, dev_type)
+        devices.append(dev)
+        self.device_found_one.emit(dev)
+
+    @pyqtSlot(bool)
+    def do_scan(self, force=False):
+        """Run one scan on the worker thread; scan_finished always follows."""
+        self._force = force
+        try:
+            self._scan()
+        finally:
+            self.scan_finished.emit()
+
+    def _scan(self):
         """
         Scan 192.168.137.x using the ARP table.
 
-        1. Read 'arp -a' and collect all entries in 192.168.137.x
+        1. Read the ARP table and collect all entries in 192.168.137.x
         2. Group IPs by MAC address
         3. Ping each IP; keep only ones that respond (drop stale ARP entries)
         4. For each MAC, pick a single alive IP (lowest) so we get exactly
@@ -277,20 +696,29 @@ class DeviceScanner(QThread):
         try:
             # 1) Grab ARP table
             try:
-                output = subprocess.check_output(
-                    ["arp", "-a"], text=True, encoding="utf-8", errors="ignore"
-                )
+                arp_rows = self._read_arp()
             except Exception as e:
                 print("[devices] ⚠️ arp -a failed:", e)
                 self.devices_found.emit([])
                 return
 
+            # Unchanged ARP table and a recent sweep: nothing new to verify
+            arp_key = frozenset(arp_rows)
+            now = time.monotonic()
+            cls = DeviceScanner
+            if (
+                    not self._force
+                    and arp_key == cls._last_arp_key
+                    and cls._last_devices is not None
+                    and now - cls._last_sweep < cls._ARP_REUSE_S
+            ):
+                self.devices_found.emit(list(cls._last_devices))
+                return
+
             # 2) Group IPs by MAC for 192.168.137.x
             ip_by_mac = {}
-            pattern = re.compile(r"(192\.168\.137\.\d+)\s+([0-9A-Fa-f:-]{11,})")
-
-            for ip, mac in pattern.findall(output):
-                mac_normalized = mac.lower().replace("-", ":")
+            for ip, mac in arp_rows:
+                mac_normalized = mac.translate(_MAC_LOWER)
 
                 # Skip the ICS gateway / host laptop itself
                 if ip == "192.168.137.1":
@@ -307,34 +735,109 @@ class DeviceScanner(QThread):
 
                 ip_by_mac.setdefault(mac_normalized, set()).add(ip)
 
-            # 3) For each MAC, keep only IPs that respond to ping
+            # 3) MACs verified within _ALIVE_TTL_S, at an IP still in the ARP table, are reported
+            #    without pinging; every other candidate IP is pinged in one sweep
+            alive_cache = cls._alive_cache
             devices = []
+            pending = {}
             for mac_norm, ips in ip_by_mac.items():
-                if not ips:
-                    continue
+                hit = None if self._force else alive_cache.get(mac_norm)
+                if hit is not None and now - hit[1] < self._ALIVE_TTL_S and hit[0] in ips:
+                    self._report(devices, hit[0], mac_norm)
+                elif ips:
+                    pending[mac_norm] = ips
+
+            alive = self._sweep_ping([ip for ips in pending.values() for ip in ips])
 
-                alive_ips = []
-                for ip in sorted(ips, key=lambda s: list(map(int, s.split(".")))):
-                    if self._ping_ip(ip):
-                        alive_ips.append(ip)
+            for mac_norm, ips in pending.items():
+                alive_ips = [
+                    ip for ip in sorted(ips, key=socket.inet_aton)
+                    if alive.get(ip)
+                ]
 
                 # If none of the IPs respond, treat this MAC as offline
                 if not alive_ips:
+                    alive_cache.pop(mac_norm, None)
                     continue
 
                 # Pick the first alive IP (lowest address)
                 ip = alive_ips[0]
-                vendor, dev_type = self._lookup_vendor_and_type(mac_norm)
-                devices.append((ip, mac_norm.upper(), vendor, dev_type))
+                alive_cache[mac_norm] = (ip, now)
+                self._report(devices, ip, mac_norm)
+
+            # forget MACs that have left the ARP table
+            for mac_norm in [m for m in alive_cache if m not in ip_by_mac]:
+                del alive_cache[mac_norm]
 
             # 4) Sort and send to UI
-            devices.sort(key=lambda x: list(map(int, x[0].split("."))))
+            # 4-byte big-endian keys compare in numeric address order
+            devices.sort(key=lambda x: socket.inet_aton(x[0]))
+            cls._last_arp_key, cls._last_devices, cls._last_sweep = arp_key, list(devices), now
             self.devices_found.emit(devices)
 
         except Exception as e:
             self.scan_error.emit(str(e))
 
 
+# 🧠 vendor keyword -> device type, checked in order (first hit wins)
+_DEV_TYPES = {
+    "SAMSUNG": "Android Phone", "OPPO": "Android Phone", "VIVO": "Android Phone",
+    "XIAOMI": "Android Phone", "HUAWEI": "Android Phone",
+    "APPLE": "iPhone / Mac",
+    "DELL": "Laptop / PC", "HP": "Laptop / PC", "LENOVO": "Laptop / PC",
+    "ASUS": "Laptop / PC", "ACER": "Laptop / PC", "MSI": "Laptop / PC",
+    "TP-LINK": "Router / IoT", "TCL": "Router / IoT", "REALME": "Router / IoT",
+}
+# all keywords in one alternation: a single C-level scan of the vendor string
+_DEV_TYPE_RE = re.compile("|".join(map(re.escape, _DEV_TYPES)))
+# table order is the precedence when a vendor name contains several keywords
+_DEV_TYPE_RANK = {kw: i for i, kw in enumerate(_DEV_TYPES)}
+
+
+@functools.lru_cache(maxsize=4096)
+def _vendor_and_type(mac):
+    """
+    (vendor, device type) for a MAC; the same MACs come back every scan, so results are
+    memoized (DeviceScanner._set_vendor_db clears the cache when the table changes).
+    """
+    try:
+        raw = bytes.fromhex(mac.translate(_MAC_HEX_UPPER))
+    except ValueError:
+        raw = b""
+    db = DeviceScanner.vendor_db
+    vendor = "Unknown Vendor"
+    for n in DeviceScanner.oui_lengths:
+        k = n >> 1
+        if n & 1:
+            # odd nibble count: keep the high nibble of the next byte (matches _oui_key padding)
+            if len(raw) <= k:
+                continue
+            key = raw[:k] + bytes((raw[k] & 0xF0,))
+        else:
+            key = raw[:k]
+        hit = db.get(key)
+        if hit:
+            vendor = hit
+            break
+
+    hits = _DEV_TYPE_RE.findall(vendor.upper())
+    if not hits:
+        return vendor, "Unknown Device"
+    return vendor, _DEV_TYPES[min(hits, key=_DEV_TYPE_RANK.__getitem__)]
+
+
+def _join_scan_thread(thread, scanner, *_):
+    """Quit the scanner thread's event loop and wait for it (an in-flight scan finishes first)."""
+    try:
+        if thread.isRunning():
+            thread.quit()
+            if not thread.wait(5000):
+                return
+        scanner.close_loop()
+    except Exception as e:
+        print(f"[NetworkControl] scanner shutdown error: {e}")
+
+
 class NetworkControlTab(QWidget):
     """
     Dashboard with 4 quadrants:
@@ -343,6 +846,9 @@ class NetworkControlTab(QWidget):
       BL: Device detection & blocking
       BR: Application signatures / blocking (height aligned with BL)
     """
+    # CSV import result from the _BG_POOL worker: (added count or None on failure, file name, error text)
+    _csv_import_done = pyqtSignal(object, str, str)
+
     def __init__(self, username: str):
         super().__init__()
         self.username = username
@@ -396,6 +902,8 @@ class NetworkControlTab(QWidget):
         w_sel_row = QHBoxLayout()
         self.select_all_btn = make_button("Select All", variant="ghost", height=26)
         w_sel_row.addWidget(self.select_all_btn)
+        self.import_sites_btn = make_button("Import CSV", variant="ghost", height=26)
+        w_sel_row.addWidget(self.import_sites_btn)
         w_sel_row.addStretch()
         w_layout.addLayout(w_sel_row)
 
@@ -417,7 +925,7 @@ class NetworkControlTab(QWidget):
         g_layout.addWidget(g_title)
 
         try:
-            self.graph = GraphWidget("Traffic (last 30 points)")
+            self.graph = _make_graph_widget("Traffic (last 30 points)")
             self.graph.setMinimumHeight(160)
             self.graph.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
             g_layout.addWidget(self.graph)
@@ -541,22 +1049,52 @@ class NetworkControlTab(QWidget):
         self.rm_site_btn.clicked.connect(self.remove_site)
         self.refresh_site_btn.clicked.connect(self.load_blocked_sites)
         self.select_all_btn.clicked.connect(self.select_all_sites)
+        self.import_sites_btn.clicked.connect(self.import_sites_csv)
 
         self.add_sig_btn.clicked.connect(self.add_signature)
         self.rm_sig_btn.clicked.connect(self.remove_signature)
         self.refresh_sig_btn.clicked.connect(self.load_signatures)
 
-        self.scan_btn.clicked.connect(self.scan_devices)
+        self.scan_btn.clicked.connect(lambda: self.scan_devices(force=True))
         self.block_dev_btn.clicked.connect(self.block_device)
         self.unblock_dev_btn.clicked.connect(self.unblock_device)
 
         # prevent overlapping scans
         self._device_scanning = False
-
-        # autos
-        self.device_timer = QTimer()
+        # blocked domains as last loaded, for is_blocked()
+        self._blocked_suffixes = frozenset()
+        # a coalesced domain-list reload is already queued
+        self._reload_pending = False
+        # IPs seen by the previous scan and how many scans in a row matched them
+        self._last_scan_ips = None
+        self._empty_cycles = 0
+        self._live_schema_ready = False  # live_devices DDL runs on the first snapshot only
+        self._blocked_ips_cache = None  # set of blocked IPs; None = re-read on next use
+        # emitted from a pool thread, so the slot runs queued on the GUI thread
+        self._csv_import_done.connect(self._on_csv_import_done)
+
+        # one long-lived scanner on its own thread; scan_devices() queues work to it
+        self._scan_thread = QThread(self)
+        self.scanner = DeviceScanner()
+        self.scanner.moveToThread(self._scan_thread)
+        self.scanner.device_found_one.connect(self._on_device_found)
+        self.scanner.devices_found.connect(self._on_scan_finished)
+        self.scanner.scan_error.connect(self._on_scan_error)
+        self.scanner.scan_finished.connect(self._on_scan_done)
+        self._scan_thread.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_scanner)
+        # QWidget emits destroyed before deleting its children, so the thread can still be
+        # joined there; the partial keeps no reference to the (already dying) tab
+        self.destroyed.connect(functools.partial(_join_scan_thread, self._scan_thread, self.scanner))
+
+        # autos: single-shot, re-armed from _on_scan_done so scans never overlap and the
+        # gap after each one is fixed (adaptive, see _adapt_scan_interval)
+        self.device_timer = QTimer(self)
+        self.device_timer.setSingleShot(True)
         self.device_timer.timeout.connect(self.scan_devices)
-        self.device_timer.start(3000)  # 3s refresh
+        self.device_timer.start(_SCAN_BASE_MS)
 
         # Ensure DB objects
         try:
@@ -572,23 +1110,63 @@ class NetworkControlTab(QWidget):
         self.scan_devices()
 
     # ------------------ WEBSITES ------------------
+    @staticmethod
+    def _refill(lst, texts, checkable=False):
+        """Replace a list's contents with one addItems batch, holding off repaints and signals until done."""
+        lst.setUpdatesEnabled(False)
+        lst.blockSignals(True)
+        try:
+            lst.clear()
+            lst.addItems(texts)
+            if checkable:
+                for i in range(lst.count()):
+                    item = lst.item(i)
+                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+                    item.setCheckState(Qt.CheckState.Unchecked)
+        finally:
+            lst.blockSignals(False)
+            lst.setUpdatesEnabled(True)
+
     def load_blocked_sites(self):
         self.domain_list.clear()
         try:
-            domains = reload_blocked_domains(self.db_path() if hasattr(self, "db_path") else DB_PATH)
+            rows = _read_rows("SELECT DISTINCT lower(domain) FROM blocked_domains ORDER BY 1")
+            if rows is not None:
+                domains = [r[0] for r in rows]
+            else:
+                domains = reload_blocked_domains(self.db_path() if hasattr(self, "db_path") else DB_PATH)
+            self._blocked_suffixes = frozenset(domains)
             if not domains:
                 self.domain_list.addItem("⚠️ No blocked domains yet.")
             else:
-                for d in domains:
-                    item = QListWidgetItem(d)
-                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                    self.domain_list.addItem(item)
+                self._refill(self.domain_list, domains, checkable=True)
         except Exception as e:
             QMessageBox.critical(self, "Database Error", f"Failed to load blocked sites:\n{e}")
 
+    def is_blocked(self, host):
+        """The blocked domain covering `host` (itself or a parent domain), else None."""
+        return match_blocked_suffix(host, self._blocked_suffixes)
+
+    def _schedule_reload(self):
+        """Coalesce the domain-list refreshes after add/remove into one reload 50 ms later."""
+        if self._reload_pending:
+            return
+        self._reload_pending = True
+        QTimer.singleShot(50, self._run_scheduled_reload)
+
+    def _run_scheduled_reload(self):
+        self._reload_pending = False
+        try:
+            self.load_blocked_sites()
+        except Exception as e:
+            print(f"[NetworkControl] scheduled reload error: {e}")
+
     def add_site(self):
         raw = self.domain_input.text()
+        tokens = [t for t in _MULTI_SPLIT_RE.split(raw) if t]
+        if len(tokens) > 1:
+            self._add_sites_bulk(tokens)
+            return
         domain = _normalize_domain(raw)
 
         if not domain:
@@ -599,16 +1177,13 @@ class NetworkControlTab(QWidget):
             )
             return
 
-        # Check duplicates in the list (compare normalized)
-        for i in range(self.domain_list.count()):
-            it = self.domain_list.item(i)
-            if not it:
-                continue
-            existing = _normalize_domain(it.text())
-            if existing and existing == domain:
-                QMessageBox.information(self, "Info", f"{domain} is already listed.")
-                self.domain_input.clear()
-                return
+        # Already blocked, directly or through a parent domain
+        hit = self.is_blocked(domain)
+        if hit:
+            msg = f"{domain} is already listed." if hit == domain else f"{domain} is already covered by {hit}."
+            QMessageBox.information(self, "Info", msg)
+            self.domain_input.clear()
+            return
 
         self.add_site_btn.setEnabled(False)
         self.rm_site_btn.setEnabled(False)
@@ -643,12 +1218,123 @@ class NetworkControlTab(QWidget):
             QMessageBox.critical(self, "Error", f"Failed to add domain:\n{e}")
         finally:
             try:
-                self.load_blocked_sites()
+                self._schedule_reload()
+            except Exception:
+                pass
+            self.add_site_btn.setEnabled(True)
+            self.rm_site_btn.setEnabled(True)
+
+    def _add_sites_bulk(self, tokens):
+        """Block several pasted domains with a single DB transaction and one IP sync."""
+        listed = set()
+        domains, invalid = [], []
+        for t in tokens:
+            d = _normalize_domain(t)
+            if not d:
+                invalid.append(t)
+            elif d not in listed and not self.is_blocked(d):
+                listed.add(d)
+                domains.append(d)
+        if not domains:
+            QMessageBox.information(self, "Info", "Nothing new to add." + (f"\nInvalid: {', '.join(invalid)}" if invalid else ""))
+            return
+
+        self.add_site_btn.setEnabled(False)
+        self.rm_site_btn.setEnabled(False)
+        try:
+            # every domain here is new to the list, so nothing inserted means the write failed
+            if not add_blocked_domains_bulk(domains, DB_PATH):
+                raise RuntimeError("no domains were written to the database (see console)")
+            try:
+                notify_firewall_reload()
+            except Exception as e:
+                print(f"[NetworkControl] notify_firewall_reload() failed: {e}")
+            try:
+                log_general_history(self.username, "Block Website", ", ".join(domains))
+            except Exception:
+                pass
+            try:
+                if hasattr(self, "home") and hasattr(self.home, "notify_overview_update"):
+                    QTimer.singleShot(0, self.home.notify_overview_update)
+            except Exception:
+                pass
+            msg = f"✅ Added {len(domains)} domains to blocked sites."
+            if invalid:
+                msg += f"\nSkipped invalid: {', '.join(invalid)}"
+            QMessageBox.information(self, "Added", msg)
+            self.domain_input.clear()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to add domains:\n{e}")
+        finally:
+            try:
+                self._schedule_reload()
             except Exception:
                 pass
             self.add_site_btn.setEnabled(True)
             self.rm_site_btn.setEnabled(True)
 
+    def import_sites_csv(self):
+        """Block every valid domain in the first column of a CSV file (header rows are skipped as invalid)."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Blocked Domains", "", "CSV files (*.csv);;Text files (*.txt);;All files (*)"
+        )
+        if not path:
+            return
+
+        def _domains(reader):
+            for row in reader:
+                if row:
+                    d = _normalize_domain(row[0])
+                    if d:
+                        yield d
+
+        name = os.path.basename(path)
+        username = self.username
+
+        def _bg():
+            added, err = None, ""
+            try:
+                # streamed: csv.reader -> generator -> executemany batches, one transaction
+                with open(path, newline="", encoding="utf-8", errors="ignore") as f:
+                    added = add_blocked_domains_bulk(_domains(csv.reader(f)), DB_PATH)
+                if added is None:
+                    err = "the database write failed (see console)"
+                elif added:
+                    try:
+                        notify_firewall_reload()
+                    except Exception as e:
+                        print(f"[NetworkControl] notify_firewall_reload() failed: {e}")
+                    try:
+                        log_general_history(username, "Import Blocked Websites", f"{added} from {name}")
+                    except Exception:
+                        pass
+            except Exception as e:
+                added, err = None, str(e)
+            try:
+                self._csv_import_done.emit(added, name, err)
+            except RuntimeError:
+                pass  # tab already deleted
+
+        self.import_sites_btn.setEnabled(False)
+        _BG_POOL.submit(_bg)
+
+    @pyqtSlot(object, str, str)
+    def _on_csv_import_done(self, added, name, err):
+        self.import_sites_btn.setEnabled(True)
+        self._schedule_reload()
+        if added is None:
+            QMessageBox.critical(self, "Error", f"Failed to import domains from {name}:\n{err}")
+            return
+        if added:
+            try:
+                if hasattr(self, "home") and hasattr(self.home, "notify_overview_update"):
+                    QTimer.singleShot(0, self.home.notify_overview_update)
+            except Exception:
+                pass
+            QMessageBox.information(self, "Import", f"✅ Imported {added} new domains.")
+        else:
+            QMessageBox.information(self, "Import", f"No new domains in {name} (all invalid or already blocked).")
+
     def remove_site(self):
         checked_domains = []
         for i in range(self.domain_list.count()):
@@ -696,7 +1382,7 @@ class NetworkControlTab(QWidget):
         except Exception:
             pass
         try:
-            self.load_blocked_sites()
+            self._schedule_reload()
         except Exception:
             pass
         try:
@@ -767,15 +1453,19 @@ class NetworkControlTab(QWidget):
     def load_signatures(self):
         self.sigs_list.clear()
         try:
-            rows = get_all_signatures(DB_PATH)
+            rows = _read_rows(
+                "SELECT id, app_name, pattern, ip_range, protocol, domain_pattern "
+                "FROM app_signatures ORDER BY app_name ASC"
+            )
+            if rows is None:
+                rows = get_all_signatures(DB_PATH)
             if not rows:
                 self.sigs_list.addItem("(No app signatures configured)")
                 return
-            for r in rows:
-                sid, name, pattern, ipr, proto, domain_pattern = r
-                proto = proto or "ANY"
-                pattern_display = pattern or domain_pattern or ""
-                self.sigs_list.addItem(f"{sid} | {name} | {pattern_display} | {ipr or ''} | {proto}")
+            self._refill(self.sigs_list, [
+                f"{sid} | {name} | {pattern or domain_pattern or ''} | {ipr or ''} | {proto or 'ANY'}"
+                for sid, name, pattern, ipr, proto, domain_pattern in rows
+            ])
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load signatures:\n{e}")
 
@@ -816,7 +1506,7 @@ class NetworkControlTab(QWidget):
                         except Exception:
                             pass
                 QTimer.singleShot(1, _done)
-        threading.Thread(target=_bg, daemon=True).start()
+        _BG_POOL.submit(_bg)
 
     def remove_signature(self):
         item = self.sigs_list.currentItem()
@@ -855,7 +1545,7 @@ class NetworkControlTab(QWidget):
                         except Exception:
                             pass
                 QTimer.singleShot(1, _done)
-        threading.Thread(target=_bg, daemon=True).start()
+        _BG_POOL.submit(_bg)
 
     # ------------------ DEVICES ------------------
     def db_path(self):
@@ -863,17 +1553,20 @@ class NetworkControlTab(QWidget):
 
     def load_blocked_devices(self):
         self.blocked_list.clear()
+        self._blocked_ips_cache = None
         try:
-            devices = get_blocked_devices()
+            devices = _read_rows("SELECT ip, mac FROM blocked_devices")
+            if devices is None:
+                devices = get_blocked_devices()
+            self._blocked_ips_cache = {ip for ip, _ in devices or ()}
             if not devices:
                 self.blocked_list.addItem("(No blocked devices)")
             else:
-                for ip, mac in devices:
-                    self.blocked_list.addItem(f"{ip} ({mac})")
+                self._refill(self.blocked_list, [f"{ip} ({mac})" for ip, mac in devices])
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load blocked devices:\n{e}")
 
-    def scan_devices(self):
+    def scan_devices(self, force=False):
         """Trigger async device scan using DeviceScanner (hotspot-focused)."""
         if self._device_scanning:
             return  # already scanning, avoid overlap
@@ -887,37 +1580,78 @@ class NetworkControlTab(QWidget):
         except Exception:
             pass
 
-        # Create and wire the QThread-based scanner
-        self.scanner = DeviceScanner()
-        self.scanner.devices_found.connect(self._on_scan_finished)
-        self.scanner.scan_error.connect(self._on_scan_error)
+        # Hand the scan to the persistent worker thread
+        self._scan_partial = False
+        QMetaObject.invokeMethod(
+            self.scanner, "do_scan", Qt.ConnectionType.QueuedConnection, Q_ARG(bool, force)
+        )
 
-        def _done():
-            self._device_scanning = False
-            try:
-                self.scan_btn.setText("🔍 Scan Now")
-                self.scan_btn.setEnabled(True)
-            except Exception:
-                pass
+    def _on_scan_done(self):
+        self._device_scanning = False
+        try:
+            self.scan_btn.setText("🔍 Scan Now")
+            self.scan_btn.setEnabled(True)
+        except Exception:
+            pass
+        # next automatic scan counts from now (also pushes back a pending one after "Scan Now")
+        if self._scan_thread.isRunning():
+            self.device_timer.start()
 
-        self.scanner.finished.connect(_done)
+    def _stop_scanner(self):
+        """
+        Stop automatic scans and the scanner thread's event loop (waits for an in-flight
+        scan to finish). Called on app quit and when the owning HomePage closes; safe to repeat.
+        """
+        try:
+            self.device_timer.stop()
+        except Exception:
+            pass
+        _join_scan_thread(self._scan_thread, self.scanner)
 
-        self.scanner.start()
+    def _blocked_ip_set(self):
+        """
+        Blocked IPs straight from blocked_devices; cached until load_blocked_devices or
+        block/unblock changes the table, so scans don't re-parse the list widget.
+        """
+        if self._blocked_ips_cache is None:
+            try:
+                rows = _read_rows("SELECT ip FROM blocked_devices")
+                if rows is None:
+                    rows = get_blocked_devices()
+                self._blocked_ips_cache = {row[0] for row in rows or ()}
+            except Exception as e:
+                print(f"[NetworkControl] blocked IP lookup error: {e}")
+                return set()
+        return self._blocked_ips_cache
+
+    @staticmethod
+    def _device_display(ip, mac, vendor, dev_type, blocked_ips):
+        marker = "❌" if ip in blocked_ips else "✅"
+        display = f"{marker} {ip} ({mac})"
+        if vendor:
+            display += f" • {vendor}"
+        if dev_type:
+            display += f" • {dev_type}"
+        return display
+
+    def _on_device_found(self, dev):
+        """Show each verified device as it arrives; _on_scan_finished then replaces the list with the full result."""
+        try:
+            if not self._scan_partial:
+                self._scan_partial = True
+                self._partial_blocked = self._blocked_ip_set()
+                self.active_list.clear()
+            ip, mac, vendor, dev_type = dev
+            self.active_list.addItem(self._device_display(ip, mac, vendor, dev_type, self._partial_blocked))
+        except Exception as e:
+            print(f"[NetworkControl] partial scan result error: {e}")
 
     def _on_scan_finished(self, devices):
         self.active_list.clear()
-        blocked_ips = set()
         devices_for_db = []
 
         # Collect currently blocked IPs
-        for i in range(self.blocked_list.count()):
-            it = self.blocked_list.item(i)
-            if not it:
-                continue
-            txt = it.text().strip()
-            if not txt or txt.startswith("("):
-                continue
-            blocked_ips.add(txt.split()[0])
+        blocked_ips = self._blocked_ip_set()
 
         # If scanner reported an error-ish condition
         if devices is None:
@@ -952,9 +1686,11 @@ class NetworkControlTab(QWidget):
                     )
             except Exception as e:
                 print(f"[NetworkControl] post-scan overview update error (empty list): {e}")
+            self._adapt_scan_interval(frozenset())
             return
 
         # Normal case: we have a list of device entries
+        displays = []
         for entry in devices:
             ip = mac = vendor = dev_type = None
             try:
@@ -989,14 +1725,7 @@ class NetworkControlTab(QWidget):
                 vendor = (vendor or "").strip()
                 dev_type = (dev_type or "").strip()
 
-                marker = "❌" if ip in blocked_ips else "✅"
-                display = f"{marker} {ip} ({mac})"
-                if vendor:
-                    display += f" • {vendor}"
-                if dev_type:
-                    display += f" • {dev_type}"
-
-                self.active_list.addItem(display)
+                displays.append(self._device_display(ip, mac, vendor, dev_type, blocked_ips))
 
                 # For DB snapshot / OverviewTab
                 devices_for_db.append((ip, mac, vendor, dev_type))
@@ -1005,6 +1734,9 @@ class NetworkControlTab(QWidget):
                 print(f"[NetworkControl] Error formatting scan entry {entry!r}: {e}")
                 continue
 
+        self._refill(self.active_list, displays)
+        self._adapt_scan_interval(frozenset(d[0] for d in devices_for_db))
+
         # --- Update live_devices table + notify overview (if wired) ---
         try:
             self._update_live_devices_db(devices_for_db)
@@ -1019,6 +1751,18 @@ class NetworkControlTab(QWidget):
         except Exception as e:
             print(f"[NetworkControl] post-scan overview update error: {e}")
 
+    def _adapt_scan_interval(self, ips):
+        """Lengthen the gap before the next scan while the IPs stay the same; reset it on any change."""
+        if ips == self._last_scan_ips:
+            self._empty_cycles += 1
+            interval = min(int(self.device_timer.interval() * _SCAN_BACKOFF), _SCAN_MAX_MS)
+        else:
+            self._empty_cycles = 0
+            interval = _SCAN_BASE_MS
+        self._last_scan_ips = ips
+        if interval != self.device_timer.interval():
+            self.device_timer.setInterval(interval)
+
     def _update_live_devices_db(self, devices_for_db):
         """
         Store the current scan result into firewall.db → live_devices table.
@@ -1028,30 +1772,31 @@ class NetworkControlTab(QWidget):
         try:
             db_path = os.path.abspath(DB_PATH)
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
-            with sqlite3.connect(db_path) as conn:
+            with _connect(db_path) as conn:
                 cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS live_devices (
-                        ip TEXT PRIMARY KEY,
-                        mac TEXT,
-                        vendor TEXT,
-                        dev_type TEXT,
-                        last_seen TEXT
+                if not self._live_schema_ready:
+                    cur.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS live_devices (
+                            ip TEXT PRIMARY KEY,
+                            mac TEXT,
+                            vendor TEXT,
+                            dev_type TEXT,
+                            last_seen TEXT
+                        )
+                        """
                     )
-                    """
-                )
                 # Clear previous snapshot
                 cur.execute("DELETE FROM live_devices")
-                # Insert fresh snapshot
+                # Insert fresh snapshot (one statement, same transaction as the DELETE)
                 from datetime import datetime
                 now = datetime.now().isoformat(timespec="seconds")
-                for ip, mac, vendor, dev_type in devices_for_db:
-                    cur.execute(
-                        "INSERT OR REPLACE INTO live_devices (ip, mac, vendor, dev_type, last_seen) VALUES (?, ?, ?, ?, ?)",
-                        (ip, mac, vendor, dev_type, now),
-                    )
+                cur.executemany(
+                    "INSERT OR REPLACE INTO live_devices (ip, mac, vendor, dev_type, last_seen) VALUES (?, ?, ?, ?, ?)",
+                    [(ip, mac, vendor, dev_type, now) for ip, mac, vendor, dev_type in devices_for_db],
+                )
                 conn.commit()
+                self._live_schema_ready = True
         except Exception as e:
             print(f"[NetworkControl] live_devices DB update error: {e}")
 
@@ -1073,6 +1818,7 @@ class NetworkControlTab(QWidget):
             return
         try:
             add_blocked_device(ip)
+            self._blocked_ips_cache = None
             log_general_history(self.username, "Block Device", ip)
             QMessageBox.information(self, "Blocked", f"⛔ {ip} blocked.")
             try:
@@ -1091,12 +1837,13 @@ class NetworkControlTab(QWidget):
             QMessageBox.warning(self, "Warning", "Select a blocked device.")
             return
         text = item.text().strip()
-        if not re.match(r"^\d+\.\d+\.\d+\.\d+", text):
+        if not _IPV4_PREFIX_RE.match(text):
             QMessageBox.warning(self, "Invalid", "Select a valid blocked device.")
             return
         ip = text.split()[0]
         try:
             remove_blocked_device(ip)
+            self._blocked_ips_cache = None
             log_general_history(self.username, "Unblock Device", ip)
             QMessageBox.information(self, "Unblocked", f"✅ {ip} unblocked.")
             try:
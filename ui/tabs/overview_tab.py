@@ -6,10 +6,11 @@ from PyQt6.QtWidgets import (
     QPushButton, QSizePolicy, QScrollArea, QHeaderView, QTableWidget, QTableWidgetItem
 )
 from PyQt6.QtGui import QFont, QCursor
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, QTimer, pyqtSignal, pyqtSlot
 from pyrewall.ui.button_styles import make_button
 
 from pyrewall.db.paths import FIREWALL_DB as DEFAULT_DB, USERS_DB, GENERAL_HISTORY_DB
+from pyrewall.db.connection import get_history_conn, open_firewall_db
 
 try:
     from pyrewall.ui.components.table_widget import TableWidget
@@ -26,6 +27,14 @@ except Exception:
                 for c, val in enumerate(row_data or []):
                     self.setItem(r, c, QTableWidgetItem(str(val)))
 
+# every firewall.db count the cards show, in one statement
+_FIREWALL_COUNTS_SQL = """
+    SELECT (SELECT COUNT(*) FROM blocked_domains),
+           (SELECT COUNT(*) FROM firewall_rules),
+           (SELECT COUNT(*) FROM app_signatures),
+           (SELECT COUNT(*) FROM live_devices)
+"""
+
 # CSS-like local style
 _OVERVIEW_STYLE = """
 QWidget {
@@ -79,6 +88,30 @@ class ClickableFrame(QFrame):
         finally:
             super().mouseReleaseEvent(ev)
 
+class _StatsSignals(QObject):
+    ready = pyqtSignal(object)
+
+
+class _StatsFetcher(QRunnable):
+    """Runs OverviewTab._fetch_stats off the GUI thread; the result comes back queued."""
+
+    def __init__(self, signals: _StatsSignals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        try:
+            stats = OverviewTab._fetch_stats()
+        except Exception as e:
+            print(f"[Pyrewall] overview stats fetch error: {e}")
+            stats = None
+        try:
+            self.signals.ready.emit(stats)
+        except RuntimeError:
+            # receiver already destroyed
+            pass
+
+
 class OverviewTab(QWidget):
     card_clicked = pyqtSignal(str)
 
@@ -223,6 +256,12 @@ class OverviewTab(QWidget):
         self.sigs_card.clicked.connect(lambda: self.card_clicked.emit("signatures"))
         self.threats_card.clicked.connect(lambda: self.card_clicked.emit("threats"))
 
+        # DB reads run on the global QThreadPool; results land in _apply_counts
+        self._in_flight = False
+        self._refresh_again = False
+        self._stats_signals = _StatsSignals(self)
+        self._stats_signals.ready.connect(self._apply_counts)
+
         # start auto-refresh timer (UI-only). 5 seconds is a reasonable default.
         self._auto_timer = QTimer(self)
         self._auto_timer.setInterval(5000)  # ms
@@ -267,162 +306,190 @@ class OverviewTab(QWidget):
         frame._small = small_lbl
         return frame
 
-    def _ensure_db_parent(self, db_path):
+    @staticmethod
+    def _ensure_db_parent(db_path):
         if not db_path:
             return
         parent = os.path.dirname(os.path.abspath(db_path))
         if parent:
             os.makedirs(parent, exist_ok=True)
 
-    def refresh_summary(self):
+    # set once the tables refresh_summary counts are known to exist (shared by all instances)
+    _schema_ready = False
+
+    @classmethod
+    def _ensure_schema(cls):
+        """Create the tables refresh_summary reads, once per process instead of every tick."""
+        if cls._schema_ready:
+            return
+        # `with conn` only commits; each connection is closed explicitly so retries don't leak handles
+        try:
+            conn = open_firewall_db(DEFAULT_DB, timeout=5.0)
+            try:
+                with conn:
+                    conn.execute("CREATE TABLE IF NOT EXISTS blocked_domains (domain TEXT UNIQUE)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS firewall_rules (id INTEGER PRIMARY KEY AUTOINCREMENT, ip TEXT, port TEXT, protocol TEXT, action TEXT)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS app_signatures (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, pattern TEXT)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS live_devices (ip TEXT PRIMARY KEY, mac TEXT, vendor TEXT, dev_type TEXT, last_seen TEXT)")
+            finally:
+                conn.close()
+            c2 = sqlite3.connect(os.path.abspath(USERS_DB))
+            try:
+                with c2:
+                    c2.execute("CREATE TABLE IF NOT EXISTS users (username TEXT PRIMARY KEY, password TEXT NOT NULL, role TEXT DEFAULT 'user')")
+            finally:
+                c2.close()
+            threats_db = os.path.abspath(os.path.join(os.path.dirname(DEFAULT_DB), "threats.db"))
+            if os.path.exists(threats_db):
+                ct = sqlite3.connect(threats_db)
+                try:
+                    with ct:
+                        ct.execute("CREATE TABLE IF NOT EXISTS threats (id INTEGER PRIMARY KEY AUTOINCREMENT)")
+                finally:
+                    ct.close()
+            cls._schema_ready = True
+        except Exception as e:
+            # left unset so the next refresh tries again; the per-card errors still show
+            print(f"[Pyrewall] overview schema check failed: {e}")
+
+    @classmethod
+    def _fetch_stats(cls):
         """
-        UI-only refresh: reads DBs and updates cards and table.
-        Non-destructive.
+        All DB reads behind the cards and the activity table; runs on a pool thread
+        (see _StatsFetcher) and touches no widgets. Returns a plain dict for _apply_counts.
         """
+        stats = {
+            "sites": 0, "rules": 0, "sigs": 0, "devices": 0, "users": 0, "threats": 0,
+            "rows": [], "fw_error": None, "users_error": None,
+        }
+        if not cls._schema_ready:
+            cls._ensure_db_parent(DEFAULT_DB)
+            cls._ensure_db_parent(USERS_DB)
+            cls._ensure_schema()
+
+        # blocked domains / rules / app signatures / live devices (updated by
+        # NetworkControlTab): one connection, one round-trip
         try:
-            self._ensure_db_parent(DEFAULT_DB)
-            self._ensure_db_parent(USERS_DB)
-
-            # blocked domains / rules
-            sites = rules = 0
+            conn = open_firewall_db(DEFAULT_DB, timeout=5.0)
             try:
-                with sqlite3.connect(os.path.abspath(DEFAULT_DB)) as conn:
-                    cur = conn.cursor()
-                    cur.execute("CREATE TABLE IF NOT EXISTS blocked_domains (domain TEXT UNIQUE)")
-                    cur.execute("CREATE TABLE IF NOT EXISTS firewall_rules (id INTEGER PRIMARY KEY AUTOINCREMENT, ip TEXT, port TEXT, protocol TEXT, action TEXT)")
-                    cur.execute("SELECT COUNT(*) FROM blocked_domains")
-                    sites = cur.fetchone()[0] or 0
-                    cur.execute("SELECT COUNT(*) FROM firewall_rules")
-                    rules = cur.fetchone()[0] or 0
-            except Exception as db_e:
-                self.sites_card._big.setText("—")
-                self.sites_card._small.setText(f"Error: {db_e}")
-                self.rules_card._big.setText("—")
-                self.rules_card._small.setText(f"Error: {db_e}")
+                row = conn.execute(_FIREWALL_COUNTS_SQL).fetchone()
+            finally:
+                conn.close()
+            stats["sites"], stats["rules"], stats["sigs"], stats["devices"] = (n or 0 for n in row)
+        except Exception as db_e:
+            stats["fw_error"] = str(db_e)
+
+        # users
+        try:
+            with sqlite3.connect(os.path.abspath(USERS_DB)) as c2:
+                cur2 = c2.cursor()
+                cur2.execute("SELECT COUNT(*) FROM users")
+                stats["users"] = cur2.fetchone()[0] or 0
+        except Exception as user_e:
+            stats["users_error"] = str(user_e)
+
+        # threats (try threats.db then fallback to general history)
+        try:
+            threats_db = os.path.abspath(os.path.join(os.path.dirname(DEFAULT_DB), "threats.db"))
+            if os.path.exists(threats_db):
+                with sqlite3.connect(threats_db) as ct:
+                    curt = ct.cursor()
+                    curt.execute("SELECT COUNT(*) FROM threats")
+                    stats["threats"] = curt.fetchone()[0] or 0
+            else:
+                curh = get_history_conn().cursor()
+                curh.execute("SELECT COUNT(*) FROM history WHERE action LIKE '%Threat%' OR action LIKE '%threat%'")
+                stats["threats"] = curh.fetchone()[0] or 0
+        except Exception:
+            stats["threats"] = 0
 
-            # users
-            users = 0
-            try:
-                with sqlite3.connect(os.path.abspath(USERS_DB)) as c2:
-                    cur2 = c2.cursor()
-                    cur2.execute("CREATE TABLE IF NOT EXISTS users (username TEXT PRIMARY KEY, password TEXT NOT NULL, role TEXT DEFAULT 'user')")
-                    cur2.execute("SELECT COUNT(*) FROM users")
-                    users = cur2.fetchone()[0] or 0
-            except Exception as user_e:
-                self.users_card._big.setText("—")
-                self.users_card._small.setText(f"Error: {user_e}")
+        # Table: last 12 history rows
+        try:
+            if os.path.exists(os.path.abspath(GENERAL_HISTORY_DB)):
+                gcur = get_history_conn().cursor()
+                gcur.execute("SELECT timestamp, action, description FROM history ORDER BY id DESC LIMIT 12")
+                rows = gcur.fetchall() or []
+                stats["rows"] = [(r[0] or "", r[1] or "", r[2] or "") for r in rows]
+        except Exception:
+            stats["rows"] = []
+        return stats
 
-            # app signatures (best-effort)
-            sig_count = 0
-            try:
-                with sqlite3.connect(os.path.abspath(DEFAULT_DB)) as conn:
-                    cur = conn.cursor()
-                    cur.execute("CREATE TABLE IF NOT EXISTS app_signatures (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, pattern TEXT)")
-                    cur.execute("SELECT COUNT(*) FROM app_signatures")
-                    sig_count = cur.fetchone()[0] or 0
-            except Exception:
-                sig_count = 0
+    @pyqtSlot()
+    def refresh_summary(self):
+        """
+        UI-only refresh: reads DBs on a pool thread, then updates cards and table.
+        Non-destructive. A call made while a fetch is running is folded into one
+        follow-up fetch.
+        """
+        if self._in_flight:
+            self._refresh_again = True
+            return
+        self._in_flight = True
+        self._refresh_again = False
+        try:
+            QThreadPool.globalInstance().start(_StatsFetcher(self._stats_signals))
+        except Exception as e:
+            self._in_flight = False
+            print(f"[Pyrewall] overview refresh not started: {e}")
 
-            # threats (try threats.db then fallback to general history)
-            threats = 0
-            try:
-                threats_db = os.path.abspath(os.path.join(os.path.dirname(DEFAULT_DB), "threats.db"))
-                if os.path.exists(threats_db):
-                    with sqlite3.connect(threats_db) as ct:
-                        curt = ct.cursor()
-                        curt.execute("CREATE TABLE IF NOT EXISTS threats (id INTEGER PRIMARY KEY AUTOINCREMENT)")
-                        curt.execute("SELECT COUNT(*) FROM threats")
-                        threats = curt.fetchone()[0] or 0
-                else:
-                    with sqlite3.connect(os.path.abspath(GENERAL_HISTORY_DB)) as ch:
-                        curh = ch.cursor()
-                        curh.execute("SELECT COUNT(*) FROM history WHERE action LIKE '%Threat%' OR action LIKE '%threat%'")
-                        threats = curh.fetchone()[0] or 0
-            except Exception:
-                threats = 0
+    @pyqtSlot(object)
+    def _apply_counts(self, stats):
+        """Push a _fetch_stats() result into the cards and table (GUI thread only)."""
+        self._in_flight = False
+        try:
+            if stats is None:
+                raise RuntimeError("stats fetch failed")
 
-            # live devices count (updated by NetworkControlTab)
-            live_devices = 0
-            try:
-                with sqlite3.connect(os.path.abspath(DEFAULT_DB)) as conn:
-                    cur = conn.cursor()
-                    cur.execute(
-                        """
-                        CREATE TABLE IF NOT EXISTS live_devices
-                        (
-                            ip
-                            TEXT
-                            PRIMARY
-                            KEY,
-                            mac
-                            TEXT,
-                            vendor
-                            TEXT,
-                            dev_type
-                            TEXT,
-                            last_seen
-                            TEXT
-                        )
-                        """
-                    )
-                    cur.execute("SELECT COUNT(*) FROM live_devices")
-                    live_devices = cur.fetchone()[0] or 0
-            except Exception:
-                live_devices = 0
+            if stats["fw_error"]:
+                self.sites_card._big.setText("—")
+                self.sites_card._small.setText(f"Error: {stats['fw_error']}")
+                self.rules_card._big.setText("—")
+                self.rules_card._small.setText(f"Error: {stats['fw_error']}")
+            if stats["users_error"]:
+                self.users_card._big.setText("—")
+                self.users_card._small.setText(f"Error: {stats['users_error']}")
 
             # Apply values to cards (only if not already an error)
             try:
                 if not self.sites_card._small.text().startswith("Error"):
-                    self.sites_card._big.setText(str(sites))
+                    self.sites_card._big.setText(str(stats["sites"]))
                     self.sites_card._small.setText("Total blocked domains")
             except Exception:
                 pass
             try:
                 if not self.rules_card._small.text().startswith("Error"):
-                    self.rules_card._big.setText(str(rules))
+                    self.rules_card._big.setText(str(stats["rules"]))
                     self.rules_card._small.setText("Configured firewall rules")
             except Exception:
                 pass
             try:
-                self.devices_card._big.setText(str(live_devices))
+                self.devices_card._big.setText(str(stats["devices"]))
                 self.devices_card._small.setText("Devices currently connected to the network")
             except Exception:
                 pass
 
             try:
                 if not self.users_card._small.text().startswith("Error"):
-                    self.users_card._big.setText(str(users))
+                    self.users_card._big.setText(str(stats["users"]))
                     self.users_card._small.setText("Accounts registered")
             except Exception:
                 pass
 
             try:
-                self.sigs_card._big.setText(str(sig_count))
+                self.sigs_card._big.setText(str(stats["sigs"]))
                 self.sigs_card._small.setText("Application signatures")
             except Exception:
                 pass
             try:
-                self.threats_card._big.setText(str(threats))
+                self.threats_card._big.setText(str(stats["threats"]))
                 self.threats_card._small.setText("Threat log entries")
             except Exception:
                 pass
 
-            # Table: last 12 history rows
             try:
-                if os.path.exists(os.path.abspath(GENERAL_HISTORY_DB)):
-                    with sqlite3.connect(os.path.abspath(GENERAL_HISTORY_DB)) as gdb:
-                        gcur = gdb.cursor()
-                        gcur.execute("SELECT timestamp, action, description FROM history ORDER BY id DESC LIMIT 12")
-                        rows = gcur.fetchall() or []
-                        rows = [(r[0] or "", r[1] or "", r[2] or "") for r in rows]
-                        self.table.load_data(rows)
-                else:
-                    self.table.load_data([])
+                self.table.load_data(stats["rows"])
             except Exception:
-                try:
-                    self.table.load_data([])
-                except Exception:
-                    pass
+                pass
 
         except Exception as e:
             self.sites_card._big.setText("—")
@@ -430,3 +497,6 @@ class OverviewTab(QWidget):
             self.devices_card._big.setText("—")
             self.users_card._big.setText("—")
             self.sites_card._small.setText(f"Error loading stats: {e}")
+        finally:
+            if self._refresh_again:
+                self.refresh_summary()